@@ -3,8 +3,10 @@ from pathlib import Path
 import ape.plugins
 
 from ._secrets import Scope, get_secret_manager
+from ._stats import STATS_FILE_NAME, stats
 from .accounts import KeyringAccount, KeyringAccountContainer
 from .config import KeyringConfig
+from .storage import account_storage, secret_storage
 
 
 @ape.plugins.register(ape.plugins.Config)
@@ -19,6 +21,11 @@ def account_types():
 
 # Sync environment variables if configured to do so.
 secret_manager = get_secret_manager(Path.cwd())
+if stats.enabled or secret_manager.config.stats:
+    stats.enable(lambda: secret_storage.data_folder / STATS_FILE_NAME)
+
+account_storage.miss_ttl = secret_storage.miss_ttl = secret_manager.config.miss_ttl
+
 secret_manager.set_environment_variables()
 
 __all__ = ["Scope", "secret_manager"]
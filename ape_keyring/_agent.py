@@ -0,0 +1,348 @@
+"""
+A long-lived signing agent, similar to ``ssh-agent``. The agent holds
+unlocked keys in memory and serves address lookups and signatures over a
+Unix domain socket, so short-lived processes can sign without resolving
+the keyring backend, reading the tracker, or prompting to unlock.
+
+Each request and response is a single line of JSON.
+"""
+
+import errno
+import json
+import os
+import socket
+import socketserver
+from collections.abc import Callable
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Optional, TypeVar
+
+from ape.logging import logger
+from ape.types import AddressType, MessageSignature, TransactionSignature
+from eth_account import Account as EthAccount
+from eth_account.messages import SignableMessage
+from eth_utils import to_bytes, to_hex
+
+from ape_keyring._key_cache import key_cache
+from ape_keyring._policy import SigningPolicy
+from ape_keyring._stats import stats
+from ape_keyring.exceptions import AgentError, AgentUnavailableError, MissingSecretError
+from ape_keyring.storage import SecretStorage
+from ape_keyring.utils import parse_private_key
+
+AGENT_SOCKET_ENV_VAR = "APE_KEYRING_AGENT_SOCKET"
+AGENT_SOCKET_NAME = "agent.sock"
+AGENT_TIMEOUT = 30.0
+
+_T = TypeVar("_T")
+
+
+def get_agent_socket_path(storage: SecretStorage) -> Path:
+    """
+    The agent's socket path: ``APE_KEYRING_AGENT_SOCKET`` if set, otherwise
+    ``agent.sock`` in the storage's data folder.
+    """
+    if path := os.environ.get(AGENT_SOCKET_ENV_VAR):
+        return Path(path)
+
+    return storage.data_folder / AGENT_SOCKET_NAME
+
+
+def get_agent(storage: SecretStorage) -> Optional["AgentClient"]:
+    """
+    Get a client for the running agent, if its socket is present.
+
+    Args:
+        storage (:class:`~ape_keyring.storage.SecretStorage`): The account storage.
+
+    Returns:
+        Optional[:class:`~ape_keyring._agent.AgentClient`]
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    path = get_agent_socket_path(storage)
+    return AgentClient(path) if path.is_socket() else None
+
+
+def call_agent(storage: SecretStorage, request: Callable[["AgentClient"], _T]) -> Optional[_T]:
+    """
+    Make a request to the running agent, if any.
+
+    Args:
+        storage (:class:`~ape_keyring.storage.SecretStorage`): The account storage.
+        request (Callable[[:class:`~ape_keyring._agent.AgentClient`], _T]): Makes
+          the request using the client.
+
+    Returns:
+        Optional[_T]: The result, or ``None`` when no agent is listening, in
+        which case the caller uses the keyring directly.
+    """
+    if (agent := get_agent(storage)) is None:
+        return None
+
+    try:
+        return request(agent)
+    except AgentUnavailableError as err:
+        logger.debug(err)
+        return None
+
+
+class AgentClient:
+    """
+    Makes requests to a running agent, one connection per request.
+    """
+
+    def __init__(self, socket_path: Path, timeout: float = AGENT_TIMEOUT):
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    def addresses(self) -> dict[str, Optional[AddressType]]:
+        """
+        Get the address of every account the agent serves.
+
+        Returns:
+            dict[str, Optional[AddressType]]: The addresses by alias. The address
+            is ``None`` when the private key is missing or corrupted.
+        """
+        return self._request("addresses")
+
+    def sign_message(self, alias: str, msg: SignableMessage) -> MessageSignature:
+        """
+        Sign a message with an account's key.
+
+        Args:
+            alias (str): The account alias.
+            msg (SignableMessage): The message.
+
+        Returns:
+            :class:`~ape.types.signatures.MessageSignature`
+        """
+        message = {name: to_hex(value) for name, value in msg._asdict().items()}
+        v, r, s = self._request("sign_message", alias=alias, message=message)
+        return MessageSignature(v=v, r=to_bytes(r), s=to_bytes(s))
+
+    def sign_transaction(self, alias: str, fields: dict) -> TransactionSignature:
+        """
+        Sign a transaction with an account's key.
+
+        Args:
+            alias (str): The account alias.
+            fields (dict): The transaction fields, as given to ``eth-account``.
+
+        Returns:
+            :class:`~ape.types.signatures.TransactionSignature`
+        """
+        v, r, s = self._request("sign_transaction", alias=alias, transaction=fields)
+        return TransactionSignature(v=v, r=to_bytes(r), s=to_bytes(s))
+
+    def _request(self, method: str, **params) -> Any:
+        request = json.dumps({"method": method, **params}, default=_encode_bytes)
+        with stats.measure("agent.request"):
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                    sock.settimeout(self.timeout)
+                    self._connect(sock)
+                    sock.sendall(f"{request}\n".encode())
+                    with sock.makefile("rb") as file:
+                        line = file.readline()
+
+            except OSError as err:
+                raise AgentError(
+                    f"Unable to reach the signing agent at '{self.socket_path}' ({err}). "
+                    "Restart it or remove the socket file."
+                ) from err
+
+        if not line:
+            raise AgentError("The signing agent closed the connection.")
+
+        response = json.loads(line)
+        if "error" in response:
+            raise AgentError(response["error"])
+
+        return response["result"]
+
+    def _connect(self, sock: socket.socket):
+        try:
+            sock.connect(str(self.socket_path))
+        except OSError as err:
+            if err.errno not in (errno.ECONNREFUSED, errno.ENOENT):
+                raise
+
+            if err.errno == errno.ECONNREFUSED:
+                # Left behind by an agent that did not exit cleanly.
+                self.socket_path.unlink(missing_ok=True)
+
+            raise AgentUnavailableError(
+                f"No signing agent is listening at '{self.socket_path}'."
+            ) from err
+
+
+class SigningAgent:
+    """
+    Serves the accounts in a storage. Keys are unlocked on first use and
+    kept until the agent stops, or for ``ttl`` seconds. Requests are never
+    prompted for; when given a signing policy, the agent enforces it, with
+    rate limits spanning every client.
+    """
+
+    def __init__(
+        self,
+        storage: SecretStorage,
+        socket_path: Path,
+        ttl: Optional[float] = None,
+        policy: Optional[SigningPolicy] = None,
+    ):
+        self.storage = storage
+        self.socket_path = socket_path
+        self.ttl = ttl
+        self.policy = policy
+        self._methods: dict[str, Callable[..., Any]] = {
+            "addresses": self.addresses,
+            "sign_message": self.sign_message,
+            "sign_transaction": self.sign_transaction,
+        }
+        self._server: Optional[socketserver.BaseServer] = None
+
+    def addresses(self) -> dict[str, Optional[AddressType]]:
+        addresses: dict[str, Optional[AddressType]] = {}
+        derived = {}
+        for alias in self.storage.keys:
+            if not alias:
+                continue
+
+            elif address := self.storage.get_metadata(alias).get("address"):
+                addresses[alias] = address
+                continue
+
+            try:
+                address = self._get_key(alias).public_key.to_checksum_address()
+            except Exception as err:
+                # Such as a key deleted outside of the plugin; it should not break the rest.
+                logger.debug(f"Unable to get address for account '{alias}': {err}")
+                addresses[alias] = None
+            else:
+                addresses[alias] = derived[alias] = address
+
+        if derived:
+            self.storage.update_metadata({a: {"address": d} for a, d in derived.items()})
+
+        return addresses
+
+    def sign_message(self, alias: str, message: dict[str, str]) -> tuple[int, int, int]:
+        msg = SignableMessage(**{name: to_bytes(hexstr=v) for name, v in message.items()})
+        with self.policy.authorize_message(alias) if self.policy else nullcontext():
+            signed_msg = EthAccount.sign_message(msg, self._get_key(alias))
+
+        return signed_msg.v, signed_msg.r, signed_msg.s
+
+    def sign_transaction(self, alias: str, transaction: dict) -> tuple[int, int, int]:
+        with (
+            self.policy.authorize_transaction(transaction, alias) if self.policy else nullcontext()
+        ):
+            signed_txn = EthAccount.sign_transaction(transaction, self._get_key(alias))
+
+        return signed_txn.v, signed_txn.r, signed_txn.s
+
+    def unlock(self):
+        """
+        Unlock every account's key now instead of upon first use.
+        """
+        for alias in self.storage.keys:
+            if alias:
+                self._get_key(alias)
+
+    def handle_request(self, line: bytes) -> dict:
+        """
+        Handle a single request.
+
+        Args:
+            line (bytes): The JSON request.
+
+        Returns:
+            dict: The response, with either a ``result`` or an ``error``.
+        """
+        try:
+            request = json.loads(line)
+            method = self._methods[request.pop("method")]
+            return {"result": method(**request)}
+
+        except Exception as err:
+            return {"error": str(err) or repr(err)}
+
+    def serve_forever(self):
+        """
+        Listen on the socket until :meth:`shutdown` is called.
+
+        Raises:
+            :class:`~ape_keyring.exceptions.AgentError`: When Unix sockets are
+              not supported or another agent is already listening.
+        """
+        if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+            raise AgentError("The signing agent requires Unix domain sockets.")
+
+        elif self.socket_path.is_socket():
+            try:
+                AgentClient(self.socket_path, timeout=1.0).addresses()
+            except AgentUnavailableError:
+                # Left behind by an agent that did not exit cleanly.
+                self.socket_path.unlink(missing_ok=True)
+            else:
+                raise AgentError(f"An agent is already listening at '{self.socket_path}'.")
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self._server = _AgentServer(str(self.socket_path), _AgentHandler)
+        self._server.agent = self  # type: ignore[attr-defined]
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+
+    def shutdown(self):
+        if self._server is not None:
+            self._server.shutdown()
+
+    def _get_key(self, alias: str):
+        if alias not in self.storage:
+            raise AgentError(f"Unknown account '{alias}'.")
+
+        def load() -> str:
+            if key := self.storage.get_secret(alias):
+                return key
+
+            raise MissingSecretError(alias)
+
+        # Include the address so a re-created account never signs with the old key.
+        address = self.storage.get_metadata(alias).get("address")
+        return key_cache.get(
+            (self.storage, alias, address), load, ttl=self.ttl, parse=parse_private_key
+        )
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+
+    class _AgentServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+        def server_bind(self):
+            # Only the owner may connect.
+            umask = os.umask(0o177)
+            try:
+                super().server_bind()
+            finally:
+                os.umask(umask)
+
+
+class _AgentHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            response = self.server.agent.handle_request(line)  # type: ignore[attr-defined]
+            self.wfile.write(f"{json.dumps(response)}\n".encode())
+
+
+def _encode_bytes(value: Any) -> str:
+    if isinstance(value, bytes):
+        return to_hex(value)
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
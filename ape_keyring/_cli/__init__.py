@@ -1,7 +1,10 @@
 import click
 
 from ape_keyring._cli.accounts import account_cli
+from ape_keyring._cli.agent import agent
+from ape_keyring._cli.migrate import migrate
 from ape_keyring._cli.secrets import secrets
+from ape_keyring._cli.stats import stats
 
 
 @click.group("keyring")
@@ -12,3 +15,6 @@ def cli():
 
 cli.add_command(account_cli)
 cli.add_command(secrets)
+cli.add_command(migrate)
+cli.add_command(stats)
+cli.add_command(agent)
@@ -1,6 +1,7 @@
 import click
 from ape import accounts
 from ape.cli import ape_cli_context, existing_alias_argument, non_existing_alias_argument
+from ape.exceptions import AccountsError
 
 from ape_keyring.utils import get_eth_account
 
@@ -12,21 +13,28 @@ def account_cli():
 
 @account_cli.command("list")
 @ape_cli_context()
-def _list(cli_ctx):
+@click.option(
+    "--sorted", "ordered", is_flag=True, help="List in alias order instead of as resolved"
+)
+def _list(cli_ctx, ordered):
     """List accounts"""
 
-    keyring_accounts = list(accounts.containers["keyring"].accounts)
+    container = accounts.containers["keyring"]
+    num_accounts = len(container)
 
-    if not keyring_accounts:
+    if not num_accounts:
         cli_ctx.logger.warning("No accounts found.")
         return
 
-    num_accounts = len(keyring_accounts)
     click.echo(f"Found {num_accounts} account{'s' if num_accounts > 1 else ''}:")
 
-    for account in keyring_accounts:
-        alias_display = f" (alias: '{account.alias}')" if account.alias else ""
-        click.echo(f"  {account.address}{alias_display}")
+    for alias, address in container.iter_addresses(ordered=ordered):
+        if not address:
+            cli_ctx.logger.warning(f"Unable to get address for account with alias '{alias}'.")
+            continue
+
+        alias_display = f" (alias: '{alias}')" if alias else ""
+        click.echo(f"  {address}{alias_display}")
 
 
 @account_cli.command(name="import")
@@ -47,6 +55,46 @@ def _import(cli_ctx, alias):
     cli_ctx.logger.success(f"A new account '{address}' has been added with the ID '{alias}'.")
 
 
+@account_cli.command(name="import-batch")
+@ape_cli_context()
+@click.argument("file", type=click.File("r"), default="-")
+def import_batch(cli_ctx, file):
+    """Add many private keys from lines of 'alias,private_key'"""
+
+    container = accounts.containers["keyring"]
+    existing = set(container.aliases)
+    batch = []
+    for line_number, line in enumerate(file, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        alias, _, key = (v.strip() for v in line.partition(","))
+        if not alias or not key:
+            cli_ctx.abort(f"Line {line_number} is not in the form 'alias,private_key'.")
+
+        elif alias in existing:
+            cli_ctx.abort(f"Account with alias '{alias}' already exists.")
+
+        existing.add(alias)
+        batch.append((alias, key))
+
+    if not batch:
+        cli_ctx.logger.warning("No accounts found.")
+        return
+
+    try:
+        addresses = container.create_accounts(batch)
+    except AccountsError as err:
+        cli_ctx.abort(str(err))
+
+    for alias, address in addresses.items():
+        click.echo(f"  {address} (alias: '{alias}')")
+
+    num_accounts = len(addresses)
+    cli_ctx.logger.success(f"Imported {num_accounts} account{'s' if num_accounts > 1 else ''}.")
+
+
 @account_cli.command()
 @ape_cli_context()
 @existing_alias_argument()
@@ -64,5 +112,17 @@ def delete_all(cli_ctx):
     """Delete all private keys from keyring"""
 
     container = accounts.containers["keyring"]
-    container.delete_all()
-    cli_ctx.logger.success("Deleted all keyring accounts.")
+    summary = container.delete_all()
+    for alias in summary.missing:
+        cli_ctx.logger.warning(f"Account '{alias}' was already missing from keyring.")
+
+    if summary.failed:
+        for alias, error in summary.failed.items():
+            cli_ctx.logger.error(f"Failed to delete account '{alias}': {error}")
+
+        cli_ctx.abort(
+            f"Deleted {len(summary.deleted)} keyring accounts; "
+            f"{len(summary.failed)} failed and remain."
+        )
+
+    cli_ctx.logger.success(f"Deleted all {len(summary.deleted)} keyring accounts.")
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import click
+from ape import accounts
+from ape.cli import ape_cli_context
+
+from ape_keyring._agent import (
+    AGENT_SOCKET_ENV_VAR,
+    AGENT_SOCKET_NAME,
+    SigningAgent,
+    get_agent_socket_path,
+)
+from ape_keyring.exceptions import AgentError
+
+
+@click.command()
+@ape_cli_context()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help=f"The socket path (default: '{AGENT_SOCKET_NAME}' in the data folder)",
+)
+@click.option("--ttl", type=float, help="Seconds to keep each unlocked key")
+@click.option("--unlock", is_flag=True, help="Unlock every account now instead of on first use")
+def agent(cli_ctx, socket_path, ttl, unlock):
+    """Serve unlocked accounts to other processes"""
+
+    storage = accounts.containers["keyring"].storage
+    socket_path = socket_path or get_agent_socket_path(storage)
+    policy_config = cli_ctx.config_manager.get_config("keyring").signing_policy
+    policy = policy_config.policy if policy_config.enabled else None
+    if policy is None:
+        cli_ctx.logger.warning(
+            "No signing policy is enabled. Any of your processes may sign with "
+            "these accounts through the agent, without a prompt."
+        )
+
+    signing_agent = SigningAgent(storage, socket_path, ttl=ttl, policy=policy)
+    if unlock:
+        signing_agent.unlock()
+
+    cli_ctx.logger.success(f"Signing agent listening at '{socket_path}'. Press Ctrl+C to stop.")
+    if socket_path != storage.data_folder / AGENT_SOCKET_NAME:
+        click.echo(f"Clients must set '{AGENT_SOCKET_ENV_VAR}={socket_path}'.")
+
+    try:
+        signing_agent.serve_forever()
+    except AgentError as err:
+        cli_ctx.abort(str(err))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,44 @@
+import click
+from ape import accounts
+from ape.cli import ape_cli_context
+
+from ape_keyring.storage import StorageLayout, TrackerFormat, secret_storage
+
+
+@click.group()
+def migrate():
+    """Migrate how data is stored"""
+
+
+@migrate.command()
+@ape_cli_context()
+@click.argument("layout", type=click.Choice([layout.value for layout in StorageLayout]))
+@click.option(
+    "--only",
+    type=click.Choice(["accounts", "secrets"]),
+    help="Only migrate accounts or secrets",
+)
+def layout(cli_ctx, layout, only):
+    """Store secrets per-key or bundled in one keyring entry"""
+
+    storages = {
+        "accounts": accounts.containers["keyring"].storage,
+        "secrets": secret_storage,
+    }
+    for name, storage in storages.items():
+        if only and name != only:
+            continue
+
+        storage.migrate(StorageLayout(layout))
+        cli_ctx.logger.success(f"Keyring {name} are stored using the '{layout}' layout.")
+
+
+@migrate.command()
+@ape_cli_context()
+@click.argument("tracker_format", type=click.Choice([f.value for f in TrackerFormat]))
+def tracker(cli_ctx, tracker_format):
+    """Re-write the tracker file on every change or append to a journal"""
+
+    storage = accounts.containers["keyring"].storage
+    storage.set_tracker_format(TrackerFormat(tracker_format))
+    cli_ctx.logger.success(f"The keyring tracker uses the '{tracker_format}' format.")
@@ -1,8 +1,16 @@
+import os
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+from typing import TextIO
+
 import click
 from ape.cli import ape_cli_context
 
+from ape_keyring._dotenv import format_dotenv, is_dotenv_key, parse_dotenv
 from ape_keyring._secrets import Scope, get_secret_manager
 from ape_keyring.args import scope_option, secret_argument
+from ape_keyring.exceptions import DotenvParseError
 
 
 @click.group()
@@ -16,7 +24,8 @@ def _list(cli_ctx):
     """List secrets"""
 
     secret_manager = get_secret_manager(cli_ctx.local_project.path)
-    if not secret_manager.secrets_exist:
+    secret_keys = secret_manager.partition()
+    if not secret_keys.exist:
         cli_ctx.logger.warning("No secrets found.")
         return
 
@@ -30,11 +39,11 @@ def _list(cli_ctx):
 
         return True
 
-    did_output = output_secret_list("Global secrets", secret_manager.global_keys)
-    if did_output and secret_manager.project_keys:
+    did_output = output_secret_list("Global secrets", secret_keys.global_keys)
+    if did_output and secret_keys.project_keys:
         click.echo()
 
-    output_secret_list("Project secrets", secret_manager.project_keys)
+    output_secret_list("Project secrets", secret_keys.project_keys)
 
 
 @secrets.command(name="set")
@@ -50,6 +59,58 @@ def _set(cli_ctx, secret, scope, value):
     cli_ctx.logger.success(f"Secret '{secret}' has been set.")
 
 
+@secrets.command()
+@ape_cli_context()
+@click.argument("file", type=click.File("r"))
+@scope_option()
+def load(cli_ctx, file, scope):
+    """Add or replace secrets from a .env file"""
+
+    try:
+        values = dict(parse_dotenv(file))
+    except DotenvParseError as err:
+        cli_ctx.abort(str(err))
+
+    if empty := [k for k, v in values.items() if not v]:
+        cli_ctx.logger.warning(f"Skipping secrets with empty values: {', '.join(empty)}.")
+        values = {k: v for k, v in values.items() if v}
+
+    if not values:
+        cli_ctx.logger.warning("No secrets found.")
+        return
+
+    secret_manager = get_secret_manager(cli_ctx.local_project.path)
+    secret_manager.store_secrets(values, scope=scope)
+    num_secrets = len(values)
+    cli_ctx.logger.success(f"Loaded {num_secrets} secret{'s' if num_secrets > 1 else ''}.")
+
+
+@secrets.command()
+@ape_cli_context()
+@click.option(
+    "--output",
+    "path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="The file to write, readable only by you (insecure)",
+)
+@scope_option()
+def export(cli_ctx, path, scope):
+    """Write secrets in .env format"""
+
+    secret_manager = get_secret_manager(cli_ctx.local_project.path)
+    skipped = []
+    with _open_private(path) if path else nullcontext(sys.stdout) as file:
+        for key, value in secret_manager.iter_secrets(scope=scope):
+            if is_dotenv_key(key):
+                file.write(f"{format_dotenv(key, value)}\n")
+            else:
+                # Could not be loaded back.
+                skipped.append(key)
+
+    if skipped:
+        cli_ctx.logger.warning(f"Skipping secrets with invalid .env names: {', '.join(skipped)}.")
+
+
 @secrets.command()
 @ape_cli_context()
 @secret_argument()
@@ -61,10 +122,10 @@ def delete(cli_ctx, secret, scope):
     did_delete = secret_manager.delete_secret(secret, scope=scope)
     if not did_delete:
         # Try to delete project secret
-        if secret_manager.get_secret(secret, scope=Scope.PROJECT):
+        if scope == Scope.GLOBAL and secret_manager.resolve(secret) == Scope.PROJECT:
             do_delete = click.confirm(f"Delete project-scoped secret '{secret}'?")
             if do_delete:
-                did_delete = secret_manager.delete_secret(secret, scope=scope.PROJECT)
+                did_delete = secret_manager.delete_secret(secret, scope=Scope.PROJECT)
 
         else:
             project_output = (
@@ -83,3 +144,14 @@ def delete(cli_ctx, secret, scope):
 
         message = f"{message}has been unset."
         cli_ctx.logger.success(message)
+
+
+def _open_private(path: Path) -> TextIO:
+    # Create the file owner-only, and restrict an existing one before writing to it.
+    file_descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.fchmod(file_descriptor, 0o600)
+    except AttributeError:  # Windows
+        pass
+
+    return os.fdopen(file_descriptor, "w")
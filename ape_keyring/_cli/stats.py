@@ -0,0 +1,38 @@
+import json
+
+import click
+from ape.cli import ape_cli_context
+
+from ape_keyring._stats import STATS_ENV_VAR, STATS_FILE_NAME, load_stats
+from ape_keyring.storage import secret_storage
+
+
+@click.command()
+@ape_cli_context()
+@click.option("--json", "as_json", is_flag=True, help="Output the raw stats as JSON")
+@click.option("--reset", is_flag=True, help="Delete the recorded stats")
+def stats(cli_ctx, as_json, reset):
+    """Show operation counts and latencies"""
+
+    path = secret_storage.data_folder / STATS_FILE_NAME
+    if reset:
+        path.unlink(missing_ok=True)
+        cli_ctx.logger.success("Stats have been reset.")
+        return
+
+    operations = load_stats(path)
+    if not operations:
+        cli_ctx.logger.warning(
+            f"No stats found. Set '{STATS_ENV_VAR}=1' or the 'stats' config to record them."
+        )
+        return
+
+    if as_json:
+        data = {name: op.model_dump() for name, op in operations.items()}
+        click.echo(json.dumps(data, indent=2))
+        return
+
+    click.echo(f"{'Operation':<26}{'Count':>10}{'Mean (ms)':>12}{'Min (ms)':>12}{'Max (ms)':>12}")
+    for name, op in operations.items():
+        mean = op.total / op.count if op.count else 0
+        click.echo(f"{name:<26}{op.count:>10}{mean:>12.3f}{op.min or 0:>12.3f}{op.max or 0:>12.3f}")
@@ -0,0 +1,108 @@
+import re
+from collections.abc import Iterable, Iterator
+
+from ape_keyring.exceptions import DotenvParseError
+
+_KEY_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_.]*$")
+_BARE_VALUE_PATTERN = re.compile(r"^[A-Za-z0-9_./:@+,=-]*$")
+_ESCAPES = {"n": "\n", "r": "\r", "t": "\t", '"': '"', "\\": "\\", "$": "$"}
+
+
+def parse_dotenv(lines: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """
+    Parse ``.env``-formatted lines as they are read.
+
+    Supports comments, an optional ``export`` prefix, single-quoted
+    (literal) values, and double-quoted values with backslash escapes.
+
+    Args:
+        lines (Iterable[str]): The lines, such as an open file.
+
+    Raises:
+        :class:`~ape_keyring.exceptions.DotenvParseError`: When a line is malformed.
+
+    Returns:
+        Iterator[tuple[str, str]]: ``(key, value)`` pairs in file order.
+    """
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        line = line.removeprefix("export ").lstrip()
+        key, separator, value = line.partition("=")
+        key = key.strip()
+        if not separator:
+            raise DotenvParseError(line_number, "expected 'KEY=value'")
+
+        elif not is_dotenv_key(key):
+            raise DotenvParseError(line_number, f"invalid key '{key}'")
+
+        yield key, _parse_value(value.strip(), line_number)
+
+
+def is_dotenv_key(key: str) -> bool:
+    """
+    Check whether a name can be used as a key in a ``.env`` file.
+
+    Args:
+        key (str): The variable name.
+
+    Returns:
+        bool: ``True`` when :func:`parse_dotenv` accepts the name.
+    """
+    return _KEY_PATTERN.match(key) is not None
+
+
+def format_dotenv(key: str, value: str) -> str:
+    """
+    Format a single ``.env`` line, quoting the value when needed.
+
+    Args:
+        key (str): The variable name.
+        value (str): The variable value.
+
+    Returns:
+        str: The line, without a trailing newline.
+    """
+    if _BARE_VALUE_PATTERN.match(value):
+        return f"{key}={value}"
+
+    escaped = (
+        value.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("$", "\\$")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+        .replace("\t", "\\t")
+    )
+    return f'{key}="{escaped}"'
+
+
+def _parse_value(value: str, line_number: int) -> str:
+    if value[:1] == "'":
+        end = value.find("'", 1)
+        if end < 0:
+            raise DotenvParseError(line_number, "unterminated single quote")
+
+        return value[1:end]
+
+    elif value[:1] == '"':
+        characters: list[str] = []
+        index = 1
+        while index < len(value):
+            character = value[index]
+            if character == '"':
+                return "".join(characters)
+
+            elif character == "\\" and index + 1 < len(value):
+                index += 1
+                character = _ESCAPES.get(value[index], f"\\{value[index]}")
+
+            characters.append(character)
+            index += 1
+
+        raise DotenvParseError(line_number, "unterminated double quote")
+
+    # Unquoted values end at an inline comment.
+    return value.split(" #", 1)[0].rstrip()
@@ -0,0 +1,105 @@
+import os
+import threading
+from collections.abc import Callable, Iterable, Iterator, MutableMapping
+
+
+class DeferredEnviron(MutableMapping):
+    """
+    A stand-in for ``os.environ`` that delays loading some variables until
+    they are first accessed. Enumerating the environment (iterating, copying,
+    or taking its length) loads everything still pending. Once nothing is
+    pending, the original ``os.environ`` is restored.
+
+    Only ``os.environ`` is replaced: references taken earlier, such as by
+    ``from os import environ``, and child processes do not see pending
+    variables until they are loaded.
+    """
+
+    def __init__(
+        self,
+        environ: MutableMapping[str, str],
+        names: Iterable[str],
+        load: Callable[[list[str]], None],
+    ):
+        """
+        Args:
+            environ (MutableMapping[str, str]): The real environment mapping.
+            names (Iterable[str]): The names of the variables to defer.
+            load (Callable[[list[str]], None]): Called with pending names
+              to set them in the environment.
+        """
+        self._environ = environ
+        self._pending = set(names)
+        self._load = load
+        self._lock = threading.RLock()
+
+    def __getitem__(self, name: str) -> str:
+        self._resolve((name,))
+        return self._environ[name]
+
+    def __setitem__(self, name: str, value: str):
+        self._environ[name] = value
+        self._discard(name)
+
+    def __delitem__(self, name: str):
+        del self._environ[name]
+        self._discard(name)
+
+    def __contains__(self, name: object) -> bool:
+        if isinstance(name, str):
+            self._resolve((name,))
+
+        return name in self._environ
+
+    def __iter__(self) -> Iterator[str]:
+        self.resolve_all()
+        return iter(self._environ)
+
+    def __len__(self) -> int:
+        self.resolve_all()
+        return len(self._environ)
+
+    def __getattr__(self, attr_name: str):
+        # Delegate implementation details, such as ``encodekey``, to the real environ.
+        return getattr(self._environ, attr_name)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} pending={len(self._pending)}>"
+
+    @property
+    def pending(self) -> set[str]:
+        return set(self._pending)
+
+    def copy(self) -> dict[str, str]:
+        self.resolve_all()
+        return dict(self._environ)
+
+    def install(self):
+        os.environ = self  # type: ignore[assignment]
+
+    def uninstall(self):
+        if os.environ is self:
+            os.environ = self._environ  # type: ignore[assignment]
+
+    def resolve_all(self):
+        self._resolve(list(self._pending))
+
+    def _discard(self, name: str):
+        # No lock: a reader may hold it while waiting on the thread setting this.
+        self._pending.discard(name)
+        if not self._pending:
+            self.uninstall()
+
+    def _resolve(self, names: Iterable[str]):
+        if not any(n in self._pending for n in names):
+            # Avoid locking for variables that were never deferred.
+            return
+
+        with self._lock:
+            to_load = [n for n in names if n in self._pending]
+            if to_load:
+                self._load(to_load)
+                self._pending.difference_update(to_load)
+
+            if not self._pending:
+                self.uninstall()
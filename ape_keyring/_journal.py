@@ -0,0 +1,183 @@
+"""
+The journal tracker format: a snapshot (``data.json``) plus an append-only
+file of JSON lines. The first line is a header naming the snapshot
+generation it applies to, so a journal left behind by an interrupted
+compaction is ignored instead of being replayed twice. Every other line
+is a list of operations on the snapshot's top-level entries.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+from ape_keyring._stats import stats, timed
+
+TRACKER_FORMAT_KEY = "tracker-format"
+TRACKER_GENERATION_KEY = "tracker-generation"
+
+
+def diff_tracker(old: dict, new: dict) -> list[list]:
+    """
+    Describe the changes from one version of the tracker data to another.
+
+    Args:
+        old (dict): The previous data.
+        new (dict): The updated data.
+
+    Returns:
+        list[list]: The operations, which :func:`apply_journal` replays.
+    """
+    ops: list[list] = [["del", name] for name in old if name not in new]
+    for name, value in new.items():
+        previous = old.get(name)
+        if name in old and previous == value:
+            continue
+
+        elif isinstance(previous, list) and isinstance(value, list):
+            value_set = set(value)
+            previous_set = set(previous)
+            removed = [v for v in previous if v not in value_set]
+            added = [v for v in value if v not in previous_set]
+            # Keys are only ever appended or removed; anything else is re-set.
+            if [v for v in previous if v in value_set] + added == value:
+                ops.extend(op for op in (["remove", name, removed], ["add", name, added]) if op[2])
+                continue
+
+        elif isinstance(previous, dict) and isinstance(value, dict):
+            popped = [k for k in previous if k not in value]
+            updated = {k: v for k, v in value.items() if k not in previous or previous[k] != v}
+            ops.extend(op for op in (["pop", name, popped], ["update", name, updated]) if op[2])
+            continue
+
+        ops.append(["set", name, value])
+
+    return ops
+
+
+def apply_journal(data: dict, records: list[Any], generation: Optional[int]) -> Optional[int]:
+    """
+    Replay journal records onto the tracker data, in place.
+
+    Args:
+        data (dict): The tracker data to update.
+        records (list[Any]): Journal lines, including any header.
+        generation (Optional[int]): The generation of the header already
+          replayed, if resuming a partially read journal.
+
+    Returns:
+        Optional[int]: The generation of the last header seen.
+    """
+    snapshot_generation = data.get(TRACKER_GENERATION_KEY)
+    # Collections are copied once and mutated in place while replaying.
+    lists: dict[str, dict[str, None]] = {}
+    dicts: dict[str, dict] = {}
+    for record in records:
+        if isinstance(record, dict):
+            generation = record.get("generation")
+            continue
+
+        elif generation is None or generation != snapshot_generation:
+            # A stale journal from before the last compaction.
+            continue
+
+        for op, name, *args in record:
+            if op in ("add", "remove"):
+                if name not in lists:
+                    lists[name] = dict.fromkeys(data.get(name, []))
+
+                if op == "add":
+                    lists[name].update(dict.fromkeys(args[0]))
+                else:
+                    for key in args[0]:
+                        lists[name].pop(key, None)
+
+            elif op in ("update", "pop"):
+                if name not in dicts:
+                    dicts[name] = dict(data.get(name, {}))
+
+                if op == "update":
+                    dicts[name].update(args[0])
+                else:
+                    for key in args[0]:
+                        dicts[name].pop(key, None)
+
+            else:
+                lists.pop(name, None)
+                dicts.pop(name, None)
+                if op == "set":
+                    data[name] = args[0]
+                else:
+                    data.pop(name, None)
+
+    for name, keys in lists.items():
+        data[name] = list(keys)
+
+    data.update(dicts)
+    return generation
+
+
+@timed("tracker.replay")
+def read_journal(path: Path, offset: int) -> tuple[tuple, list[Any], int]:
+    """
+    Read the complete lines of a journal starting at the given offset.
+
+    Args:
+        path (Path): The journal path.
+        offset (int): The number of bytes already read.
+
+    Returns:
+        tuple[tuple, list[Any], int]: The file signature, the parsed lines,
+        and the offset after the last complete line.
+    """
+    with open(path, "rb") as file:
+        # Stat before reading so a concurrent append changes the signature.
+        stat = os.fstat(file.fileno())
+        signature = (str(path), stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        file.seek(offset)
+        content = file.read()
+
+    records = []
+    # A line without a newline is being written, or was never finished.
+    end = content.rfind(b"\n") + 1
+    for line in content[:end].splitlines():
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            continue
+
+    return signature, records, offset + end
+
+
+def append_journal(path: Path, offset: int, ops: list[list]) -> int:
+    """
+    Durably append a record to the journal, discarding any unfinished line
+    left after the given offset by a writer that crashed.
+
+    Args:
+        path (Path): The journal path.
+        offset (int): The offset after the last complete line.
+        ops (list[list]): The operations to record.
+
+    Returns:
+        int: The offset after the new record.
+    """
+    line = f"{json.dumps(ops)}\n".encode()
+    with stats.measure("tracker.append"):
+        file_descriptor = os.open(path, os.O_WRONLY)
+        try:
+            os.ftruncate(file_descriptor, offset)
+            os.lseek(file_descriptor, offset, os.SEEK_SET)
+            written = 0
+            while written < len(line):
+                written += os.write(file_descriptor, line[written:])
+
+            os.fsync(file_descriptor)
+        finally:
+            os.close(file_descriptor)
+
+    return offset + len(line)
+
+
+def journal_header(generation: int) -> str:
+    return f"{json.dumps({'generation': generation})}\n"
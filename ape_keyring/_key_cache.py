@@ -0,0 +1,193 @@
+import atexit
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any, Optional
+
+
+class CachedKey:
+    """
+    A private key held in memory for a limited time or number of uses.
+    Wiping the key overwrites the cache's own buffer with zeros. The strings
+    returned by :meth:`use`, like the one it was loaded from, are immutable
+    copies that are only freed once unreferenced.
+    """
+
+    def __init__(self, key: str, ttl: Optional[float] = None, max_uses: Optional[int] = None):
+        self._key = bytearray(key.encode())
+        self._parsed: dict[Callable[[str], Any], Any] = {}
+        self._expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._uses_left = max_uses
+
+    @property
+    def expired(self) -> bool:
+        if not self._key:
+            return True
+
+        elif self._expires_at is not None and time.monotonic() >= self._expires_at:
+            return True
+
+        return self._uses_left is not None and self._uses_left <= 0
+
+    def use(self, parse: Optional[Callable[[str], Any]] = None) -> Any:
+        """
+        Get the key, counting it as a use.
+
+        Args:
+            parse (Optional[Callable[[str], Any]]): Converts the key, such as
+              into a signing-key object. The result is kept until the key is wiped.
+
+        Returns:
+            Any: The key, or its parsed form if given ``parse``, or ``None``
+            if it has expired.
+        """
+        if self.expired:
+            self.wipe()
+            return None
+
+        if self._uses_left is not None:
+            self._uses_left -= 1
+
+        if parse is None:
+            return self._key.decode()
+
+        elif parse not in self._parsed:
+            self._parsed[parse] = parse(self._key.decode())
+
+        return self._parsed[parse]
+
+    def wipe(self):
+        for idx in range(len(self._key)):
+            self._key[idx] = 0
+
+        self._key = bytearray()
+        self._parsed.clear()
+
+
+class KeyCache:
+    """
+    Unlocked private keys, shared by every account instance loaded
+    for the same storage entry. Loading one key, which may prompt to
+    unlock it, does not block using or loading the others. Keys are
+    wiped as soon as their ``ttl`` elapses or their last use is taken.
+    """
+
+    def __init__(self):
+        self._keys: dict[Hashable, CachedKey] = {}
+        self._timers: dict[Hashable, threading.Timer] = {}
+        self._lock = threading.Lock()
+        self._load_locks: dict[Hashable, threading.Lock] = {}
+        # Bumped when clearing, so a key loaded meanwhile is not cached.
+        self._generation = 0
+
+    def __contains__(self, cache_key: Hashable) -> bool:
+        with self._lock:
+            cached = self._keys.get(cache_key)
+            return cached is not None and not cached.expired
+
+    def get(
+        self,
+        cache_key: Hashable,
+        load: Callable[[], str],
+        ttl: Optional[float] = None,
+        max_uses: Optional[int] = None,
+        parse: Optional[Callable[[str], Any]] = None,
+    ) -> Any:
+        """
+        Get a cached key, loading and caching it when missing or expired.
+
+        Args:
+            cache_key (Hashable): The cache entry identifier.
+            load (Callable[[], str]): Loads the key from storage.
+            ttl (Optional[float]): Seconds before a newly loaded key expires.
+            max_uses (Optional[int]): Uses before a newly loaded key expires.
+            parse (Optional[Callable[[str], Any]]): Converts the key, caching
+              the result alongside it.
+
+        Returns:
+            Any: The key, or its parsed form if given ``parse``.
+        """
+        with self._lock:
+            self._purge()
+            if (value := self._use(cache_key, parse)) is not None:
+                return value
+
+            load_lock = self._load_locks.setdefault(cache_key, threading.Lock())
+
+        # Only one thread loads a given key; the others wait for it.
+        with load_lock:
+            with self._lock:
+                if (value := self._use(cache_key, parse)) is not None:
+                    return value
+
+                generation = self._generation
+
+            key = load()
+            cached = CachedKey(key, ttl=ttl, max_uses=max_uses)
+            with self._lock:
+                if generation == self._generation:
+                    self._keys[cache_key] = cached
+                    value = self._use(cache_key, parse)
+                    if ttl is not None and cache_key in self._keys:
+                        self._schedule_wipe(cache_key, ttl)
+
+            if value is None:
+                # Cleared while loading, or expired immediately, such as
+                # when given a ``ttl`` of 0.
+                cached.wipe()
+                value = key if parse is None else parse(key)
+
+            return value
+
+    def clear(self, cache_key: Optional[Hashable] = None):
+        """
+        Wipe a cached key, or all cached keys when not given one.
+
+        Args:
+            cache_key (Optional[Hashable]): The cache entry identifier.
+        """
+        with self._lock:
+            self._generation += 1
+            to_clear = list(self._keys) if cache_key is None else [cache_key]
+            for key in to_clear:
+                self._remove(key)
+
+    def _use(self, cache_key: Hashable, parse: Optional[Callable[[str], Any]]) -> Any:
+        if (cached := self._keys.get(cache_key)) is None:
+            return None
+
+        value = cached.use(parse=parse)
+        if cached.expired:
+            # Such as after its last use; the caller still has its copy.
+            self._remove(cache_key)
+
+        return value
+
+    def _purge(self):
+        for cache_key, cached in list(self._keys.items()):
+            if cached.expired:
+                self._remove(cache_key)
+
+    def _schedule_wipe(self, cache_key: Hashable, ttl: float):
+        cached = self._keys[cache_key]
+
+        def expire():
+            with self._lock:
+                if self._keys.get(cache_key) is cached:
+                    self._remove(cache_key)
+
+        timer = threading.Timer(ttl, expire)
+        timer.daemon = True
+        self._timers[cache_key] = timer
+        timer.start()
+
+    def _remove(self, cache_key: Hashable):
+        if timer := self._timers.pop(cache_key, None):
+            timer.cancel()
+
+        if cached := self._keys.pop(cache_key, None):
+            cached.wipe()
+
+
+key_cache = KeyCache()
+atexit.register(key_cache.clear)
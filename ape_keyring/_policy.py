@@ -0,0 +1,137 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
+from typing import Optional
+
+from eth_utils import to_checksum_address
+
+from ape_keyring.exceptions import SigningPolicyError
+
+
+class SigningPolicy:
+    """
+    Signing rules, normalized up front so checking a signature is only a
+    few set lookups and comparisons.
+    """
+
+    def __init__(
+        self,
+        allowed_receivers: Optional[list[str]] = None,
+        max_value: Optional[int] = None,
+        chain_ids: Optional[list[int]] = None,
+        rate_limits: Optional[list[tuple[int, float]]] = None,
+    ):
+        self._allowed_receivers = (
+            None
+            if allowed_receivers is None
+            else frozenset(to_checksum_address(a) for a in allowed_receivers)
+        )
+        self._max_value = max_value
+        self._chain_ids = None if chain_ids is None else frozenset(chain_ids)
+        self._rate_limits = sorted(rate_limits or [], key=lambda limit: limit[1])
+        self._longest_window = self._rate_limits[-1][1] if self._rate_limits else 0.0
+
+        # Recent signature times, by signer.
+        self._history: dict[Hashable, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def authorize_transaction(self, fields: dict, signer: Hashable) -> Iterator[None]:
+        """
+        Check a transaction against the rules, counting it as a signature
+        unless signing it fails.
+
+        Args:
+            fields (dict): The transaction fields, as given to ``eth-account``.
+            signer (Hashable): Identifies the account for rate limiting.
+
+        Raises:
+            :class:`~ape_keyring.exceptions.SigningPolicyError`: When forbidden.
+        """
+        self.check_transaction(fields)
+        with self._rate_limited(signer):
+            yield
+
+    def check_transaction(self, fields: dict):
+        """
+        Check a transaction against every rule except the rate limits,
+        without counting it.
+
+        Args:
+            fields (dict): The transaction fields, as given to ``eth-account``.
+
+        Raises:
+            :class:`~ape_keyring.exceptions.SigningPolicyError`: When forbidden.
+        """
+        chain_id = fields.get("chainId")
+        receiver = fields.get("to")
+        value = fields.get("value", 0)
+        if self._chain_ids is not None and chain_id not in self._chain_ids:
+            raise SigningPolicyError(f"Chain ID '{chain_id}' is not allowed.")
+
+        elif self._allowed_receivers is not None and (
+            not receiver or to_checksum_address(receiver) not in self._allowed_receivers
+        ):
+            raise SigningPolicyError(f"Receiver '{receiver}' is not allowed.")
+
+        elif self._max_value is not None and value > self._max_value:
+            raise SigningPolicyError(f"Value '{value}' exceeds the maximum of '{self._max_value}'.")
+
+    @contextmanager
+    def authorize_message(self, signer: Hashable) -> Iterator[None]:
+        """
+        Check a message signature against the rate limits, counting it
+        unless signing it fails.
+
+        Args:
+            signer (Hashable): Identifies the account for rate limiting.
+
+        Raises:
+            :class:`~ape_keyring.exceptions.SigningPolicyError`: When forbidden.
+        """
+        with self._rate_limited(signer):
+            yield
+
+    @contextmanager
+    def _rate_limited(self, signer: Hashable) -> Iterator[None]:
+        # Reserve the signature up front so concurrent signers cannot exceed a limit.
+        signed_at = self._check_rate(signer)
+        try:
+            yield
+        except BaseException:
+            if signed_at is not None:
+                with self._lock:
+                    history = self._history[signer]
+                    if signed_at in history:
+                        history.remove(signed_at)
+
+            raise
+
+    def _check_rate(self, signer: Hashable) -> Optional[float]:
+        if not self._rate_limits:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            history = self._history.setdefault(signer, deque())
+            while history and history[0] <= now - self._longest_window:
+                history.popleft()
+
+            for max_signatures, window in self._rate_limits:
+                # Only count back as far as needed; the history is in time order.
+                count = 0
+                for signed_at in reversed(history):
+                    if signed_at <= now - window or count >= max_signatures:
+                        break
+
+                    count += 1
+
+                if count >= max_signatures:
+                    raise SigningPolicyError(
+                        f"Rate limit of {max_signatures} signatures per {window}s reached."
+                    )
+
+            history.append(now)
+            return now
@@ -1,12 +1,21 @@
 import os
+import re
+import threading
+from collections.abc import Iterator
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Union
+from typing import NamedTuple, Optional, Union
 
 from ape.utils import ManagerAccessMixin, load_config
 
-from ape_keyring.config import KeyringConfig
+from ape_keyring._environ import DeferredEnviron
+from ape_keyring._stats import stats
+from ape_keyring.config import EnvVarSync, KeyringConfig
 from ape_keyring.storage import SecretStorage, secret_storage
+from ape_keyring.utils import get_file_signature
+
+_PROJECT_KEY_PATTERN = re.compile(r"^(.*)<<project=(.*)>>$", re.DOTALL)
+_config_cache: dict[Path, tuple[Optional[tuple], KeyringConfig]] = {}
 
 
 class Scope(Enum):
@@ -14,10 +23,27 @@ class Scope(Enum):
     PROJECT = "project"
 
 
+class SecretKeys(NamedTuple):
+    """
+    The keys visible to a project, partitioned by scope.
+    """
+
+    global_keys: list[str]
+    project_keys: list[str]
+
+    @property
+    def exist(self) -> bool:
+        return bool(self.global_keys or self.project_keys)
+
+
 class SecretManager(ManagerAccessMixin):
     def __init__(self, project_path: Path, storage: SecretStorage):
         self._path = project_path
         self._storage = storage
+        self._deferred_environ: Optional[DeferredEnviron] = None
+        self._env_var_thread: Optional[threading.Thread] = None
+        # The tracker last checked for unindexed project keys.
+        self._indexed_signature: Optional[tuple] = None
 
     @property
     def project_name(self) -> str:
@@ -33,37 +59,155 @@ class SecretManager(ManagerAccessMixin):
 
     @property
     def secrets_exist(self) -> bool:
-        return self.project_keys or self.global_keys  # type: ignore
+        return self.partition().exist
 
     @property
     def project_keys(self) -> list[str]:
-        keys = self._storage.keys
-        return [k.replace(self._project_key, "") for k in keys if self._project_key in k]
+        return self.partition().project_keys
 
     @property
     def global_keys(self) -> list[str]:
-        keys = self._storage.keys
-        return [k for k in keys if k not in self.project_keys and self._project_key_prefix not in k]
+        return self.partition().global_keys
+
+    def partition(self) -> SecretKeys:
+        """
+        Split the stored keys into global and project-scoped keys. Project
+        keys come from the tracker's index of the project, so only global
+        keys require a pass over the tracker. Global keys shadowed by a
+        project-scoped key of the same name are excluded, as are suffixed
+        project keys missing from the index, such as those written by older
+        versions of the plugin.
+
+        Returns:
+            :class:`~ape_keyring._secrets.SecretKeys`
+        """
+        project_keys = list(self._get_project_index())
+        project_key_set = set(project_keys)
+        global_keys = [
+            k
+            for k in self._storage.keys
+            if k not in project_key_set
+            and self._project_key_prefix not in k
+            and self._storage.get_key_namespace(k) is None
+        ]
+        return SecretKeys(global_keys=global_keys, project_keys=project_keys)
+
+    def resolve(self, key: str) -> Optional[Scope]:
+        """
+        Find which scope a secret resolves to for this project: the project
+        scope if it has the secret, otherwise the global scope. Only the
+        tracker is consulted.
+
+        Args:
+            key (str): The secret's name.
+
+        Returns:
+            Optional[:class:`~ape_keyring._secrets.Scope`]: ``None`` if the
+            secret is in neither scope.
+        """
+        if key in self._get_project_index():
+            return Scope.PROJECT
+
+        elif (
+            key in self._storage
+            and self._project_key_prefix not in key
+            and self._storage.get_key_namespace(key) is None
+        ):
+            return Scope.GLOBAL
+
+        return None
 
     @property
     def config(self) -> KeyringConfig:
-        raw_config = load_config(self._path / "ape-config.yaml")
-        return KeyringConfig.model_validate(raw_config.get("keyring", {}))
+        # Only re-parse the config file when it changes.
+        path = self._path / "ape-config.yaml"
+        signature = get_file_signature(path)
+        cached = _config_cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        with stats.measure("config.load"):
+            raw_config = load_config(path)
+            config = KeyringConfig.model_validate(raw_config.get("keyring", {}))
+
+        _config_cache[path] = (signature, config)
+        return config
 
     @property
     def do_set_env_vars(self) -> bool:
         stored_value = self.config.model_dump(mode="json", by_alias=True).get("set_env_vars") or "f"
         return str(stored_value).lower() in ["1", "true", "t"]
 
-    def get_secret(self, key, scope: Union[str, Scope] = Scope.GLOBAL) -> str:
+    def get_secret(
+        self, key, scope: Union[str, Scope] = Scope.GLOBAL, resolve: bool = False
+    ) -> str:
+        if resolve:
+            # Project scope first, then global.
+            resolved_scope = self.resolve(key)
+            if resolved_scope is None:
+                return ""
+
+            scope = resolved_scope
+
         key = self._get_key(key, scope)
         return self._storage.get_secret(key) or ""
 
     def store_secret(self, key: str, secret: str, scope: Union[str, Scope] = Scope.GLOBAL):
-        key = self._get_key(key, scope)
-        self._storage.store_secret(key, secret)
+        self.store_secrets({key: secret}, scope=scope)
+
+    def store_secrets(self, secrets: dict[str, str], scope: Union[str, Scope] = Scope.GLOBAL):
+        """
+        Add or replace many secrets, updating the tracker once.
+
+        Args:
+            secrets (dict[str, str]): The secret values by name.
+            scope (Union[str, :class:`~ape_keyring._secrets.Scope`]): The scope
+              of all the secrets.
+        """
+        keys = {k: self._get_key(k, scope) for k in secrets}
+        namespaces = None
+        if self._is_project_scope(scope):
+            self._get_project_index()  # Index any existing project keys first.
+            namespaces = {self.project_name: keys}
+
+        secrets = {keys[k]: v for k, v in secrets.items()}
+        self._storage.store_secrets(secrets, namespaces=namespaces)
         if self.do_set_env_vars:
-            self._set_env_var(key, secret)
+            for key, secret in secrets.items():
+                self._set_env_var(key, secret)
+
+    def get_secrets(self, scope: Union[str, Scope] = Scope.GLOBAL) -> dict[str, str]:
+        """
+        Get every secret in the given scope.
+
+        Args:
+            scope (Union[str, :class:`~ape_keyring._secrets.Scope`]): The scope.
+
+        Returns:
+            dict[str, str]: The secret values by name. Secrets missing from
+            the backend are skipped.
+        """
+        return dict(self.iter_secrets(scope=scope))
+
+    def iter_secrets(self, scope: Union[str, Scope] = Scope.GLOBAL) -> Iterator[tuple[str, str]]:
+        """
+        Stream every secret in the given scope, prefetching upcoming secrets
+        while the current one is consumed.
+
+        Args:
+            scope (Union[str, :class:`~ape_keyring._secrets.Scope`]): The scope.
+
+        Returns:
+            Iterator[tuple[str, str]]: ``(name, secret)`` pairs. Secrets missing
+            from the backend are skipped.
+        """
+        if self._is_project_scope(scope):
+            keys = {k: n for n, k in self._get_project_index().items()}
+        else:
+            keys = {self._get_key(n, scope): n for n in self.partition().global_keys}
+
+        for key, secret in self._storage.iter_items(keys):
+            yield keys[key], secret
 
     def delete_secret(self, key: str, scope: Union[str, Scope] = Scope.GLOBAL) -> bool:
         key = self._get_key(key, scope)
@@ -76,15 +220,98 @@ class SecretManager(ManagerAccessMixin):
     def set_environment_variables(self):
         """
         Set the environment variables if told to from the config.
+        Depending on the ``env_var_sync`` config, the secrets are either
+        loaded now, on a background thread, or when first accessed.
         """
         if not self.do_set_env_vars:
             return
 
-        for key, value in self._storage:
-            self._set_env_var(key, value)
+        config = self.config
+        env_var_keys = self._get_env_var_keys(config.env_var_keys)
+        if not env_var_keys:
+            return
+
+        if config.env_var_sync == EnvVarSync.EAGER:
+            self._load_env_vars(list(env_var_keys.values()))
+            return
+
+        if config.env_var_sync == EnvVarSync.BACKGROUND:
+            thread = threading.Thread(
+                target=self._load_env_vars,
+                args=(list(env_var_keys.values()),),
+                name="ape-keyring-env-vars",
+                daemon=True,
+            )
+
+            def load(names: list[str]):
+                thread.join()
+
+        else:
+
+            def load(names: list[str]):
+                self._load_env_vars([env_var_keys[n] for n in names])
+
+        self._deferred_environ = DeferredEnviron(os.environ, env_var_keys, load)
+        self._deferred_environ.install()
+        if config.env_var_sync == EnvVarSync.BACKGROUND:
+            self._env_var_thread = thread
+            thread.start()
+
+    def ensure_environment_variables(self):
+        """
+        Wait for any deferred environment variables to finish loading.
+        Call this before handing the environment to a subprocess when
+        using ``env_var_sync: lazy`` or ``env_var_sync: background``.
+        """
+        if self._env_var_thread is not None:
+            self._env_var_thread.join()
+            self._env_var_thread = None
+
+        if self._deferred_environ is not None:
+            self._deferred_environ.resolve_all()
+            self._deferred_environ.uninstall()
+            self._deferred_environ = None
+
+    def _get_env_var_keys(self, names: Optional[list[str]] = None) -> dict[str, str]:
+        # Map environment variable names to their storage keys.
+        env_var_keys = {self._extract_env_var_key(k): k for k in self._storage.keys}
+        if names is None:
+            return env_var_keys
+
+        return {n: env_var_keys[n] for n in names if n in env_var_keys}
+
+    def _load_env_vars(self, keys: list[str]):
+        for key, secret in self._storage.iter_items(keys):
+            self._set_env_var(key, secret)
 
     def _get_key(self, key: str, scope: Union[str, Scope]):
-        return f"{key}{self._project_key}" if scope in [Scope.PROJECT, Scope.PROJECT.value] else key
+        return f"{key}{self._project_key}" if self._is_project_scope(scope) else key
+
+    def _is_project_scope(self, scope: Union[str, Scope]) -> bool:
+        return scope in [Scope.PROJECT, Scope.PROJECT.value]
+
+    def _get_project_index(self) -> dict[str, str]:
+        # Project keys by name, from the tracker's per-project index.
+        if self._storage.tracker_signature != self._indexed_signature:
+            self._index_project_keys()
+            self._indexed_signature = self._storage.tracker_signature
+
+        return self._storage.get_namespace(self.project_name)
+
+    def _index_project_keys(self):
+        # Index keys scoped by their '<<project=NAME>>' suffix but missing from the
+        # index, such as when stored before it existed or by an older plugin version.
+        namespaces: dict[str, dict[str, str]] = {}
+        for key in self._storage.keys:
+            if (match := _PROJECT_KEY_PATTERN.match(key)) is None:
+                continue
+
+            name, project_name = match.groups()
+            if self._storage.get_key_namespace(key) is None:
+                namespaces.setdefault(project_name, {})[name] = key
+
+        if namespaces or not self._storage.namespaces_indexed:
+            self._storage.update_namespaces(namespaces)
 
     def _set_env_var(self, key: str, value: str):
         # Strip of 'project=' and '<<>>' parts before setting as env var.
@@ -104,4 +331,4 @@ def get_secret_manager(project_path: Path, storage: Optional[SecretStorage] = No
     return SecretManager(project_path, storage or secret_storage)
 
 
-__all__ = ["get_secret_manager", "Scope", "SecretManager"]
+__all__ = ["get_secret_manager", "Scope", "SecretKeys", "SecretManager"]
@@ -0,0 +1,193 @@
+import atexit
+import json
+import os
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from time import perf_counter
+from typing import Optional, TypeVar
+
+from ape_keyring.utils import atomic_write, file_lock
+
+STATS_ENV_VAR = "APE_KEYRING_STATS"
+STATS_FILE_NAME = "stats.json"
+STATS_LOCK_TIMEOUT = 5.0
+
+# Upper bounds of the latency histogram buckets, in milliseconds.
+LATENCY_BUCKETS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000)
+
+_F = TypeVar("_F", bound=Callable)
+
+
+class OperationStats:
+    """
+    The count and latency histogram of a single operation.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def record(self, seconds: float):
+        milliseconds = seconds * 1000
+        self.count += 1
+        self.total += milliseconds
+        self.min = milliseconds if self.min is None else min(self.min, milliseconds)
+        self.max = milliseconds if self.max is None else max(self.max, milliseconds)
+        self.buckets[_get_bucket_index(milliseconds)] += 1
+
+    def merge(self, other: "OperationStats"):
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+
+    def model_dump(self) -> dict:
+        return {
+            "count": self.count,
+            "total_ms": self.total,
+            "min_ms": self.min,
+            "max_ms": self.max,
+            "buckets": self.buckets,
+        }
+
+    @classmethod
+    def model_validate(cls, data: dict) -> "OperationStats":
+        stats = cls()
+        stats.count = data.get("count", 0)
+        stats.total = data.get("total_ms", 0.0)
+        stats.min = data.get("min_ms")
+        stats.max = data.get("max_ms")
+        buckets = data.get("buckets", [])
+        if len(buckets) == len(stats.buckets):
+            stats.buckets = buckets
+
+        return stats
+
+
+class Stats:
+    """
+    Operation counters and latencies, such as tracker-file reads and
+    keyring backend calls. Disabled unless the ``APE_KEYRING_STATS``
+    environment variable or the ``stats`` config is set.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._get_path: Optional[Callable[[], Path]] = None
+        self._operations: dict[str, OperationStats] = {}
+        self._lock = threading.Lock()
+        self._registered_dump = False
+
+    @property
+    def operations(self) -> dict[str, OperationStats]:
+        with self._lock:
+            return dict(self._operations)
+
+    def enable(self, get_path: Optional[Callable[[], Path]] = None):
+        """
+        Start recording, dumping the stats to a file at exit.
+
+        Args:
+            get_path (Optional[Callable[[], Path]]): Resolves the stats file
+              when dumping. Existing stats in the file are merged.
+        """
+        self.enabled = True
+        self._get_path = get_path or self._get_path
+        if not self._registered_dump:
+            atexit.register(self.dump)
+            self._registered_dump = True
+
+    def record(self, name: str, seconds: float):
+        with self._lock:
+            if name not in self._operations:
+                self._operations[name] = OperationStats()
+
+            self._operations[name].record(seconds)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, perf_counter() - start)
+
+    def reset(self):
+        with self._lock:
+            self._operations = {}
+
+    def dump(self):
+        """
+        Merge the recorded stats into the stats file, if there is one.
+        """
+        if self._get_path is None or not self._operations:
+            return
+
+        path = self._get_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with file_lock(path.with_suffix(".lock"), STATS_LOCK_TIMEOUT):
+            operations = load_stats(path)
+            for name, operation in self.operations.items():
+                operations.setdefault(name, OperationStats()).merge(operation)
+
+            data = {name: op.model_dump() for name, op in sorted(operations.items())}
+            atomic_write(path, json.dumps(data))
+
+        self.reset()
+
+
+def timed(name: str) -> Callable[[_F], _F]:
+    """
+    Record the calls to the decorated function under the given operation name.
+    When stats are disabled, the only overhead is a flag check.
+    """
+
+    def decorator(func: _F) -> _F:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not stats.enabled:
+                return func(*args, **kwargs)
+
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats.record(name, perf_counter() - start)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def load_stats(path: Path) -> dict[str, OperationStats]:
+    if not path.is_file():
+        return {}
+
+    data = json.loads(path.read_text() or "{}")
+    return {name: OperationStats.model_validate(op) for name, op in data.items()}
+
+
+def _get_bucket_index(milliseconds: float) -> int:
+    for idx, upper_bound in enumerate(LATENCY_BUCKETS_MS):
+        if milliseconds <= upper_bound:
+            return idx
+
+    return len(LATENCY_BUCKETS_MS)
+
+
+stats = Stats()
+stats.enabled = os.getenv(STATS_ENV_VAR, "").lower() in ("1", "true", "t")
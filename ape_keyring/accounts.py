@@ -1,4 +1,6 @@
-from collections.abc import Iterator
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
 from typing import Any, Optional
 
 from ape.api import AccountAPI, AccountContainerAPI, TransactionAPI
@@ -9,12 +11,34 @@ from ape.utils import cached_property
 from eip712 import EIP712Message
 from eth_account import Account as EthAccount
 from eth_account.messages import SignableMessage, encode_defunct
+from eth_keys.datatypes import PrivateKey
 from eth_pydantic_types import HexBytes
 from eth_utils import to_bytes
 
+from ape_keyring._agent import call_agent
+from ape_keyring._key_cache import key_cache
+from ape_keyring._policy import SigningPolicy
+from ape_keyring._stats import stats
 from ape_keyring.exceptions import EmptyAliasError, MissingSecretError
-from ape_keyring.storage import SecretStorage, account_storage
-from ape_keyring.utils import agree_to_sign, get_eth_account
+from ape_keyring.storage import DeleteSummary, SecretStorage, account_storage
+from ape_keyring.utils import (
+    agree_to_sign,
+    agree_to_sign_many,
+    derive_addresses,
+    get_eth_account,
+    get_process_pool_context,
+    get_transaction_fields,
+    parse_private_key,
+    run_in_executor,
+)
+
+ADDRESS_DERIVATION_CHUNK_SIZE = 64
+
+
+def _get_cache_key(storage: SecretStorage, alias: str) -> tuple:
+    # Include the recorded address so an account re-created elsewhere
+    # never signs with the old key.
+    return (storage, alias, storage.get_metadata(alias).get("address"))
 
 
 class KeyringAccountContainer(AccountContainerAPI):
@@ -35,11 +59,158 @@ class KeyringAccountContainer(AccountContainerAPI):
     def __len__(self) -> int:
         return len([a for a in self.aliases if a])
 
+    def __getitem__(self, address: AddressType) -> AccountAPI:
+        if (agent_addresses := self._agent_addresses()) is not None:
+            for agent_alias, agent_address in agent_addresses.items():
+                if agent_address == address:
+                    return self.load(agent_alias)
+
+            raise KeyError(f"No local account {address}.")
+
+        if alias := self.storage.find_by_metadata("address", address):
+            return self.load(alias)
+
+        # Check accounts created before addresses were recorded (backfills them).
+        for alias in self.aliases:
+            if alias and "address" not in self.storage.get_metadata(alias):
+                account = self.load(alias)
+                if account.address == address:
+                    return account
+
+        raise KeyError(f"No local account {address}.")
+
+    def iter_addresses(self, ordered: bool = False) -> Iterator[tuple[str, Optional[AddressType]]]:
+        """
+        Iterate over ``(alias, address)`` pairs without loading any private
+        key whose address is already recorded. The remaining addresses are
+        derived in parallel and recorded once iteration stops.
+
+        Args:
+            ordered (bool): Set to ``True`` to yield in alias order. Otherwise,
+              recorded addresses come first and the rest as they are derived.
+
+        Returns:
+            Iterator[tuple[str, Optional[AddressType]]]: The address is ``None``
+            when the private key is missing or corrupted.
+        """
+        if (agent_addresses := self._agent_addresses()) is not None:
+            yield from agent_addresses.items()
+            return
+
+        aliases = list(self.aliases)
+        addresses = {a: self.storage.get_metadata(a).get("address") for a in aliases}
+        missing = [a for a in aliases if not addresses[a]]
+        derived: dict[str, dict] = {}
+        results = self._derive_addresses(missing, ordered=ordered)
+        try:
+            if ordered:
+                for alias in aliases:
+                    if not addresses[alias]:
+                        _, addresses[alias] = next(results)
+                        if addresses[alias]:
+                            derived[alias] = {"address": addresses[alias]}
+
+                    yield alias, addresses[alias]
+
+            else:
+                for alias in aliases:
+                    if addresses[alias]:
+                        yield alias, addresses[alias]
+
+                for alias, address in results:
+                    if address:
+                        derived[alias] = {"address": address}
+
+                    yield alias, address
+
+        finally:
+            results.close()
+            if derived:
+                self.storage.update_metadata(derived)
+
+    def _agent_addresses(self) -> Optional[dict[str, Optional[AddressType]]]:
+        # ``None`` when no signing agent is running.
+        return call_agent(self.storage, lambda agent: agent.addresses())
+
+    def _derive_addresses(
+        self,
+        aliases: list[str],
+        keys: Optional[dict[str, Optional[str]]] = None,
+        ordered: bool = False,
+    ) -> Generator[tuple[str, Optional[AddressType]], None, None]:
+        if not aliases:
+            return
+
+        keys = self.storage.get_many(aliases) if keys is None else keys
+        chunks: list[list[str]] = []
+        for alias in aliases:
+            if not chunks or len(chunks[-1]) >= ADDRESS_DERIVATION_CHUNK_SIZE:
+                chunks.append([])
+
+            chunks[-1].append(alias)
+
+        context = get_process_pool_context() if len(chunks) > 1 else None
+        if context is None:
+            for chunk in chunks:
+                yield from zip(chunk, derive_addresses([keys[a] for a in chunk]))
+
+            return
+
+        with ProcessPoolExecutor(mp_context=context) as pool:
+            futures = {
+                pool.submit(derive_addresses, [keys[a] for a in chunk]): chunk for chunk in chunks
+            }
+            try:
+                for future in futures if ordered else as_completed(futures):
+                    yield from zip(futures[future], future.result())
+
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def create_accounts(self, accounts: Iterable[tuple[str, str]]) -> dict[str, AddressType]:
+        """
+        Add many accounts, validating their private keys in parallel and
+        updating the tracker once. Nothing is stored if any key is invalid.
+
+        Args:
+            accounts (Iterable[tuple[str, str]]): ``(alias, private_key)`` pairs.
+
+        Raises:
+            :class:`~ape_keyring.exceptions.EmptyAliasError`: When an alias is empty.
+            :class:`~ape.exceptions.AccountsError`: When any private key is invalid.
+
+        Returns:
+            dict[str, AddressType]: The new accounts' addresses by alias.
+        """
+        keys: dict[str, Optional[str]] = {}
+        for alias, private_key in accounts:
+            if not alias:
+                raise EmptyAliasError()
+
+            keys[alias] = private_key
+
+        addresses = dict(self._derive_addresses(list(keys), keys=keys, ordered=True))
+        if invalid := [a for a, address in addresses.items() if not address]:
+            raise AccountsError(f"Invalid private keys for aliases: {', '.join(invalid)}.")
+
+        for alias in keys:
+            key_cache.clear(_get_cache_key(self.storage, alias))
+
+        self.storage.store_secrets(
+            {a: k for a, k in keys.items() if k},
+            metadata={a: {"address": address} for a, address in addresses.items()},
+        )
+        return addresses  # type: ignore[return-value]
+
     def create_account(self, alias: str, secret: str):
         if not alias:
             raise EmptyAliasError()
 
-        self.storage.store_secret(alias, secret)
+        eth_account = get_eth_account(secret)
+        metadata = {"address": eth_account.address} if eth_account else None
+        key_cache.clear(_get_cache_key(self.storage, alias))
+        self.storage.store_secret(alias, secret, metadata=metadata)
         if not self.storage.get_secret(alias):
             raise AccountsError(f"Failed to create account '{alias}'")
 
@@ -47,10 +218,14 @@ class KeyringAccountContainer(AccountContainerAPI):
         if not alias:
             raise EmptyAliasError()
 
+        key_cache.clear(_get_cache_key(self.storage, alias))
         self.storage.delete_secret(alias)
 
-    def delete_all(self):
-        self.storage.delete_all()
+    def delete_all(self) -> DeleteSummary:
+        for alias in self.storage.keys:
+            key_cache.clear(_get_cache_key(self.storage, alias))
+
+        return self.storage.delete_all()
 
 
 class KeyringAccount(AccountAPI):
@@ -69,10 +244,18 @@ class KeyringAccount(AccountAPI):
     @cached_property
     def address(self) -> AddressType:
         if not self.cached_address:
-            eth_account = get_eth_account(self.__key)
-            if eth_account:
+            agent_addresses = call_agent(self.storage, lambda agent: agent.addresses())
+            if agent_addresses is not None:
+                self.cached_address = agent_addresses.get(self.storage_key)
+
+            elif address := self.storage.get_metadata(self.storage_key).get("address"):
+                self.cached_address = address
+
+            elif eth_account := get_eth_account(self.__key):
                 ethereum = self.network_manager.get_ecosystem("ethereum")
                 self.cached_address = ethereum.decode_address(eth_account.address)
+                # Record the address so it never requires the key again.
+                self.storage.set_metadata(self.storage_key, address=self.cached_address)
 
         if not self.cached_address:
             raise AccountsError("Account private key corrupted.")
@@ -81,6 +264,33 @@ class KeyringAccount(AccountAPI):
 
     @property
     def __key(self) -> str:
+        cache_config = self.config_manager.get_config("keyring").key_cache
+        if not cache_config.enabled:
+            return self.__load_key()
+
+        return key_cache.get(
+            _get_cache_key(self.storage, self.storage_key),
+            self.__load_key,
+            ttl=cache_config.ttl,
+            max_uses=cache_config.max_uses,
+        )
+
+    @property
+    def __signing_key(self) -> PrivateKey:
+        # The parsed key lives as long as the cached key, if caching.
+        cache_config = self.config_manager.get_config("keyring").key_cache
+        if not cache_config.enabled:
+            return parse_private_key(self.__load_key())
+
+        return key_cache.get(
+            _get_cache_key(self.storage, self.storage_key),
+            self.__load_key,
+            ttl=cache_config.ttl,
+            max_uses=cache_config.max_uses,
+            parse=parse_private_key,
+        )
+
+    def __load_key(self) -> str:
         key = self.storage.get_secret(self.storage_key)
         if not key:
             raise MissingSecretError(self.storage_key)
@@ -126,7 +336,20 @@ class KeyringAccount(AccountAPI):
             logger.warning("Unsupported message type, (type=%r, msg=%r)", type(msg), msg)
             return None
 
-        signed_msg = EthAccount.sign_message(msg, self.__key)
+        # The agent applies its own rate limits.
+        signature = call_agent(
+            self.storage, lambda agent: agent.sign_message(self.storage_key, msg)
+        )
+        if signature is not None:
+            return signature
+
+        policy = self._signing_policy
+        signer = (self.storage, self.storage_key)
+        with policy.authorize_message(signer) if policy else nullcontext():
+            key = self.__signing_key
+            with stats.measure("account.sign_message"):
+                signed_msg = EthAccount.sign_message(msg, key)
+
         return MessageSignature(
             v=signed_msg.v,
             r=to_bytes(signed_msg.r),
@@ -134,17 +357,109 @@ class KeyringAccount(AccountAPI):
         )
 
     def sign_transaction(self, txn: TransactionAPI, **signer_options) -> Optional[TransactionAPI]:
-        if not self.__autosign and not agree_to_sign(txn, "transaction"):
+        policy = self._signing_policy
+        if not policy and not self.__autosign and not agree_to_sign(txn, "transaction"):
             return None
 
-        signed_txn = EthAccount.sign_transaction(
-            txn.model_dump(by_alias=True, mode="json"), self.__key
-        )
-        txn.signature = TransactionSignature(
-            v=signed_txn.v, r=to_bytes(signed_txn.r), s=to_bytes(signed_txn.s)
+        return self.__sign_transaction(txn, policy, lambda: self.__signing_key)
+
+    def sign_transactions(
+        self, txns: Iterable[TransactionAPI], **signer_options
+    ) -> Iterator[TransactionAPI]:
+        """
+        Sign many transactions, loading the private key once and asking
+        for a single confirmation covering all of them. When autosign or a
+        signing policy is enabled, the transactions are signed as they are
+        consumed, each checked against the policy. When caching keys, each
+        signature counts as a use of the cached key.
+
+        Args:
+            txns (Iterable[:class:`~ape.api.transactions.TransactionAPI`]):
+              The transactions to sign.
+
+        Returns:
+            Iterator[:class:`~ape.api.transactions.TransactionAPI`]: The signed
+            transactions. Nothing is yielded if the confirmation is declined.
+        """
+        policy = self._signing_policy
+        if not policy and not self.__autosign:
+            txns = list(txns)
+            if not txns or not agree_to_sign_many(txns, "transaction"):
+                return
+
+        keys: list[PrivateKey] = []
+        cache_config = self.config_manager.get_config("keyring").key_cache
+
+        def get_key() -> PrivateKey:
+            if cache_config.enabled:
+                # Each signature counts against the cached key's ``max_uses``.
+                return self.__signing_key
+
+            elif not keys:
+                keys.append(self.__signing_key)
+
+            return keys[0]
+
+        for txn in txns:
+            yield self.__sign_transaction(txn, policy, get_key)
+
+    def __sign_transaction(
+        self,
+        txn: TransactionAPI,
+        policy: Optional[SigningPolicy],
+        get_key: Callable[[], PrivateKey],
+    ) -> TransactionAPI:
+        fields = get_transaction_fields(txn)
+        if policy:
+            # The agent applies its own rate limits, but may not have these rules.
+            policy.check_transaction(fields)
+
+        signature = call_agent(
+            self.storage, lambda agent: agent.sign_transaction(self.storage_key, fields)
         )
+        if signature is None:
+            signer = (self.storage, self.storage_key)
+            with policy.authorize_transaction(fields, signer) if policy else nullcontext():
+                key = get_key()
+                with stats.measure("account.sign_transaction"):
+                    signed_txn = EthAccount.sign_transaction(fields, key)
+
+            signature = TransactionSignature(
+                v=signed_txn.v, r=to_bytes(signed_txn.r), s=to_bytes(signed_txn.s)
+            )
+
+        txn.signature = signature
         return txn
 
+    async def async_sign_message(self, msg: Any, **signer_options) -> Optional[MessageSignature]:
+        """
+        Sign a message without blocking the event loop. At most
+        ``async_workers`` (see the plugin config) signatures run at once.
+        """
+        return await run_in_executor(
+            self.sign_message, msg, max_workers=self._async_workers, **signer_options
+        )
+
+    async def async_sign_transaction(
+        self, txn: TransactionAPI, **signer_options
+    ) -> Optional[TransactionAPI]:
+        """
+        Sign a transaction without blocking the event loop. At most
+        ``async_workers`` (see the plugin config) signatures run at once.
+        """
+        return await run_in_executor(
+            self.sign_transaction, txn, max_workers=self._async_workers, **signer_options
+        )
+
+    @property
+    def _signing_policy(self) -> Optional[SigningPolicy]:
+        config = self.config_manager.get_config("keyring").signing_policy
+        return config.policy if config.enabled else None
+
+    @property
+    def _async_workers(self) -> int:
+        return self.config_manager.get_config("keyring").async_workers
+
     def set_autosign(self, enabled: bool):
         """
         Allow this account to automatically sign messages and transactions.
@@ -1,5 +1,91 @@
+from enum import Enum
+from functools import cached_property
+from typing import Optional
+
 from ape.api import PluginConfig
+from pydantic import model_validator
+
+from ape_keyring._policy import SigningPolicy
+from ape_keyring.storage import MISS_TTL
+
+
+class EnvVarSync(str, Enum):
+    EAGER = "eager"
+    """Load all secrets into the environment when the plugin is imported."""
+
+    LAZY = "lazy"
+    """Load each secret into the environment the first time it is accessed."""
+
+    BACKGROUND = "background"
+    """Load secrets on a background thread, waiting for it upon first access."""
+
+
+class KeyCacheConfig(PluginConfig):
+    enabled: bool = False
+    """Keep unlocked account keys in memory between signatures."""
+
+    ttl: Optional[float] = 300
+    """Seconds before a cached key is wiped. ``None`` for no time limit."""
+
+    max_uses: Optional[int] = None
+    """Signatures before a cached key is wiped. ``None`` for no limit."""
+
+
+class RateLimitConfig(PluginConfig):
+    max_signatures: int
+    """Signatures allowed per account within the window."""
+
+    window: float
+    """The window length in seconds."""
+
+
+class SigningPolicyConfig(PluginConfig):
+    enabled: bool = False
+    """
+    Sign without prompting when a transaction satisfies every rule,
+    and refuse to sign when it does not.
+    """
+
+    allowed_receivers: Optional[list[str]] = None
+    """Addresses transactions may be sent to. ``None`` for any."""
+
+    max_value: Optional[int] = None
+    """The most wei a transaction may send. ``None`` for no limit."""
+
+    chain_ids: Optional[list[int]] = None
+    """Chain IDs transactions may be signed for. ``None`` for any."""
+
+    rate_limits: list[RateLimitConfig] = []
+    """Limits on signatures (transactions and messages) per account."""
+
+    @model_validator(mode="after")
+    def check_rules(self):
+        rules = (self.allowed_receivers, self.max_value, self.chain_ids, self.rate_limits or None)
+        if self.enabled and all(rule is None for rule in rules):
+            # Otherwise, every signature would be allowed without a prompt.
+            raise ValueError("An enabled signing policy requires at least one rule.")
+
+        return self
+
+    @cached_property
+    def policy(self) -> SigningPolicy:
+        """
+        The rules, compiled once per config.
+        """
+        return SigningPolicy(
+            allowed_receivers=self.allowed_receivers,
+            max_value=self.max_value,
+            chain_ids=self.chain_ids,
+            rate_limits=[(r.max_signatures, r.window) for r in self.rate_limits],
+        )
 
 
 class KeyringConfig(PluginConfig):
     set_env_vars: bool = False
+    key_cache: KeyCacheConfig = KeyCacheConfig()
+    async_workers: int = 4
+    stats: bool = False
+    env_var_sync: EnvVarSync = EnvVarSync.EAGER
+    env_var_keys: Optional[list[str]] = None
+    signing_policy: SigningPolicyConfig = SigningPolicyConfig()
+    miss_ttl: float = MISS_TTL
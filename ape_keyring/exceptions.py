@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from ape.exceptions import AccountsError, ApeException
 
 
@@ -18,6 +20,25 @@ class EmptyAliasError(ApeKeyringAccountError):
         super().__init__("Alias cannot be empty.")
 
 
+class SigningPolicyError(ApeKeyringAccountError):
+    """
+    Raised when the signing policy forbids a signature.
+    """
+
+
+class AgentError(ApeKeyringAccountError):
+    """
+    Raised when the signing agent is unreachable or refuses a request.
+    """
+
+
+class AgentUnavailableError(AgentError):
+    """
+    Raised when no signing agent is listening on the socket, such as when
+    it was killed and left the socket file behind.
+    """
+
+
 class SecretNotExistsError(ApeKeyringException):
     """
     Raised when trying to use a secret that does not exist.
@@ -34,3 +55,22 @@ class MissingSecretError(ApeKeyringException):
 
     def __init__(self, alias: str):
         super().__init__(f"Missing secret for account with alias '{alias}'.")
+
+
+class TrackerLockError(ApeKeyringException):
+    """
+    Raised when unable to acquire the tracker-file lock in time,
+    such as when another process is stuck writing to it.
+    """
+
+    def __init__(self, lock_path: Path, timeout: float):
+        super().__init__(f"Timed out after {timeout}s waiting for lock '{lock_path}'.")
+
+
+class DotenvParseError(ApeKeyringException):
+    """
+    Raised when a line of a ``.env`` file is malformed.
+    """
+
+    def __init__(self, line_number: int, reason: str):
+        super().__init__(f"Invalid .env line {line_number}: {reason}.")
@@ -1,34 +1,138 @@
 import json
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import NamedTuple, Optional, TypeVar
 
 import keyring
 from ape.logging import logger
 from ape.utils import ManagerAccessMixin
 from keyring.errors import PasswordDeleteError
 
+from ape_keyring._journal import (
+    TRACKER_FORMAT_KEY,
+    TRACKER_GENERATION_KEY,
+    append_journal,
+    apply_journal,
+    diff_tracker,
+    journal_header,
+    read_journal,
+)
+from ape_keyring._stats import stats, timed
+from ape_keyring.utils import atomic_write, file_lock, get_file_signature, run_in_executor
+
 SERVICE_NAME = "ape-keyring"
 ACCOUNTS_TRACKER_KEY = "ape-keyring-accounts"
 SECRETS_TRACKER_KEY = "ape-keyring-secrets"
+TRACKER_LOCK_TIMEOUT = 10.0
+MAX_WORKERS = 8
+PREFETCH_WINDOW = MAX_WORKERS
+JOURNAL_COMPACT_SIZE = 1 << 20
+MISS_TTL = 5.0
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+class StorageLayout(str, Enum):
+    PER_KEY = "per-key"
+    """Each secret is a separate OS keyring item."""
+
+    BUNDLED = "bundled"
+    """All secrets are serialized into a single OS keyring item."""
+
+
+class TrackerFormat(str, Enum):
+    JSON = "json"
+    """The tracker file is re-written on every change."""
+
+    JOURNAL = "journal"
+    """Changes are appended to a journal that is compacted into the tracker file."""
+
+
+class DeleteSummary(NamedTuple):
+    """
+    The outcome of deleting all items from a storage.
+    """
+
+    deleted: list[str]
+    """Keys removed from the keyring backend."""
+
+    missing: list[str]
+    """Tracked keys that were already absent from the backend."""
+
+    failed: dict[str, str]
+    """Errors by key for items that could not be deleted and remain tracked."""
 
 
 class SecretStorage(ManagerAccessMixin):
-    def __init__(self, tracker_key: str):
+    def __init__(
+        self,
+        tracker_key: str,
+        lock_timeout: float = TRACKER_LOCK_TIMEOUT,
+        max_workers: int = MAX_WORKERS,
+        journal_compact_size: int = JOURNAL_COMPACT_SIZE,
+        miss_ttl: float = MISS_TTL,
+    ):
         """
         Initialize a new base-storage class.
 
         Args:
             tracker_key (str): The key-name for storing a comma-separated list
               of items tracked.
+            lock_timeout (float): The amount of seconds to wait for other
+              processes to finish writing the tracker file.
+            max_workers (int): The maximum number of concurrent requests
+              to the keyring backend for bulk operations.
+            journal_compact_size (int): The size in bytes after which the
+              journal is compacted in the background, when using the
+              ``journal`` tracker format.
+            miss_ttl (float): The amount of seconds to remember that a secret
+              was not found, so probing for it again skips the keyring backend.
+              Storing the secret, or any change to the tracker file, such as by
+              another process, forgets the miss. Set to ``0`` to disable.
         """
 
         self._tracker_key = tracker_key
+        self.lock_timeout = lock_timeout
+        self.max_workers = max_workers
+        self.journal_compact_size = journal_compact_size
+        self.miss_ttl = miss_ttl
+
+        # Parsed tracker-file cache, reloaded only when the file changes on disk.
+        self._tracker_signature: Optional[tuple] = None
+        self._tracker_data: dict = {}
+        self._tracker_keys: list[str] = []
+        self._tracker_key_set: set[str] = set()
+        self._tracker_metadata: dict[str, dict] = {}
+        self._metadata_indexes: dict[str, dict] = {}
+        self._namespace_index: Optional[dict[str, str]] = None
+
+        # How far the journal has been replayed, and the generation it applies to.
+        self._journal_offset = 0
+        self._journal_generation: Optional[int] = None
+        self._compaction: Optional[threading.Thread] = None
+
+        # Expiry times of recent misses, and counts of all and cached misses.
+        self._misses: dict[str, float] = {}
+        self.miss_count = 0
+        self.cached_miss_count = 0
+
+        # The bundled secrets, valid while the tracker's vault revision matches.
+        self._vault: Optional[dict[str, str]] = None
+        self._vault_revision: Optional[int] = None
 
     def __iter__(self):
-        for key in self.keys:
-            secret = self.get_secret(key)
-            if secret:
-                yield key, secret
+        yield from self.iter_items()
+
+    def __contains__(self, key: str) -> bool:
+        self._load_tracker()
+        return key in self._tracker_key_set
 
     @property
     def data_folder(self) -> Path:
@@ -48,11 +152,29 @@ class SecretStorage(ManagerAccessMixin):
         return self.data_folder / "data.json"
 
     @property
-    def plugin_data(self) -> dict:
-        if self.data_file_path.is_file():
-            return json.loads(self.data_file_path.read_text())
+    def lock_file_path(self) -> Path:
+        return self.data_folder / "data.json.lock"
+
+    @property
+    def journal_file_path(self) -> Path:
+        return self.data_folder / "data.journal"
+
+    @property
+    def tracker_format(self) -> TrackerFormat:
+        """
+        How changes are written to the tracker file. This applies to every
+        storage sharing the data folder.
 
-        return {}
+        Returns:
+            :class:`~ape_keyring.storage.TrackerFormat`
+        """
+        self._load_tracker()
+        return TrackerFormat(self._tracker_data.get(TRACKER_FORMAT_KEY, TrackerFormat.JSON))
+
+    @property
+    def plugin_data(self) -> dict:
+        self._load_tracker()
+        return dict(self._tracker_data)
 
     @property
     def keys(self) -> list[str]:
@@ -63,7 +185,155 @@ class SecretStorage(ManagerAccessMixin):
             List[str]
         """
 
-        return self.plugin_data.get(self._tracker_key, [])
+        self._load_tracker()
+        return list(self._tracker_keys)
+
+    @property
+    def layout(self) -> StorageLayout:
+        """
+        How the secrets are laid out in the OS secure-storage.
+
+        Returns:
+            :class:`~ape_keyring.storage.StorageLayout`
+        """
+        self._load_tracker()
+        return StorageLayout(self._tracker_data.get(self.layout_key, StorageLayout.PER_KEY))
+
+    @property
+    def layout_key(self) -> str:
+        return f"{self._tracker_key}-layout"
+
+    @property
+    def vault_key(self) -> str:
+        return f"{self._tracker_key}-vault"
+
+    @property
+    def vault_revision_key(self) -> str:
+        return f"{self._tracker_key}-vault-revision"
+
+    @property
+    def metadata_key(self) -> str:
+        return f"{self._tracker_key}-metadata"
+
+    @property
+    def namespaces_key(self) -> str:
+        return f"{self._tracker_key}-namespaces"
+
+    @property
+    def tracker_signature(self) -> Optional[tuple]:
+        """
+        Identifies the current state of the tracker file. It changes whenever
+        the tracker is written, by this or any other process.
+        """
+        self._load_tracker()
+        return self._tracker_signature
+
+    @property
+    def namespaces_indexed(self) -> bool:
+        """
+        ``True`` once namespaces have been recorded in the tracker, even if
+        there are none.
+        """
+        self._load_tracker()
+        return self.namespaces_key in self._tracker_data
+
+    def get_namespace(self, namespace: str) -> dict[str, str]:
+        """
+        Get the keys recorded in a namespace, such as a project, without
+        scanning the other keys.
+
+        Args:
+            namespace (str): The namespace.
+
+        Returns:
+            dict[str, str]: Keys by their name within the namespace.
+        """
+        self._load_tracker()
+        return dict(self._tracker_data.get(self.namespaces_key, {}).get(namespace, {}))
+
+    def get_key_namespace(self, key: str) -> Optional[str]:
+        """
+        Get the namespace a key was recorded in.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            Optional[str]: The namespace, or ``None`` if the key has none.
+        """
+        self._load_tracker()
+        return self._get_namespace_index().get(key)
+
+    def update_namespaces(self, namespaces: dict[str, dict[str, str]]):
+        """
+        Record tracked keys in namespaces in a single tracker write. Marks the
+        namespaces as indexed, even if there are none.
+
+        Args:
+            namespaces (dict[str, dict[str, str]]): Keys by their name within
+              each namespace.
+        """
+        self._load_tracker()
+        namespaces = {
+            namespace: {n: k for n, k in keys.items() if k in self._tracker_key_set}
+            for namespace, keys in namespaces.items()
+        }
+        self._track(namespaces=namespaces)
+
+    def get_metadata(self, key: str) -> dict:
+        """
+        Get the public data recorded alongside a secret, such as an
+        account's address. Reading it never touches the OS secure-storage.
+
+        Args:
+            key (str): The key for the secret.
+
+        Returns:
+            dict
+        """
+        self._load_tracker()
+        return dict(self._tracker_metadata.get(key, {}))
+
+    def set_metadata(self, key: str, **values):
+        """
+        Record public data alongside a tracked secret.
+
+        Args:
+            key (str): The key for the secret.
+            **values: The public data to record.
+        """
+        self.update_metadata({key: values})
+
+    def update_metadata(self, metadata: dict[str, dict]):
+        """
+        Record public data for many tracked secrets in a single tracker write.
+
+        Args:
+            metadata (dict[str, dict]): The public data by secret key.
+        """
+        self._load_tracker()
+        metadata = {k: v for k, v in metadata.items() if k in self._tracker_key_set}
+        if metadata:
+            self._track(metadata=metadata)
+
+    def find_by_metadata(self, field: str, value) -> Optional[str]:
+        """
+        Find the key of the secret whose public data has the given value.
+
+        Args:
+            field (str): The public data field name, such as ``"address"``.
+            value (Any): The value to look for.
+
+        Returns:
+            Optional[str]: The key, if found.
+        """
+        self._load_tracker()
+        if field not in self._metadata_indexes:
+            self._metadata_indexes[field] = {
+                m[field]: k for k, m in self._tracker_metadata.items() if field in m
+            }
+
+        return self._metadata_indexes[field].get(value)
 
     def get_secret(self, key: str) -> Optional[str]:
         """
@@ -76,45 +346,529 @@ class SecretStorage(ManagerAccessMixin):
         Returns:
             str: The secret value from the OS secure-storage.
         """
-        if key not in self.keys:
-            return None
+        return self.get_many([key])[key]
+
+    async def async_get_secret(self, key: str) -> Optional[str]:
+        """
+        Get a secret without blocking the event loop. At most ``max_workers``
+        lookups run at once.
+
+        Args:
+            key (str): The key for the secret.
+
+        Returns:
+            str: The secret value from the OS secure-storage.
+        """
+        return await run_in_executor(self.get_secret, key, max_workers=self.max_workers)
+
+    def get_many(
+        self, keys: Iterable[str], use_miss_cache: bool = True
+    ) -> dict[str, Optional[str]]:
+        """
+        Get many secrets at once, using concurrent backend lookups.
+
+        Args:
+            keys (Iterable[str]): The keys of the secrets.
+            use_miss_cache (bool): Set to ``False`` to look up recently missed
+              secrets again, such as before rewriting the stored secrets.
+
+        Returns:
+            dict[str, Optional[str]]: The secrets, in the order of the given keys.
+              Untracked or missing secrets are ``None``.
+        """
+        keys = list(keys)
+        # Also forgets the misses if the tracker changed.
+        self._load_tracker()
+        now = time.monotonic()
+        cached_misses = (
+            {k for k in keys if self._misses.get(k, 0) > now} if use_miss_cache else set()
+        )
+        to_lookup = [k for k in keys if k not in cached_misses]
+        found: dict[str, Optional[str]] = {}
+        if to_lookup:
+            tracked = self._tracker_key_set
+            to_fetch = [k for k in to_lookup if k in tracked]
+            found = dict(zip(to_fetch, self._get_many(to_fetch)))
+
+        secrets = {k: found.get(k) for k in keys}
+        misses = [k for k in to_lookup if secrets[k] is None]
+        if misses and self.miss_ttl > 0:
+            expiry = now + self.miss_ttl
+            self._misses.update(dict.fromkeys(misses, expiry))
+
+        if stats.enabled:
+            for _ in cached_misses:
+                stats.record("storage.cached_miss", 0.0)
+
+        self.miss_count += len(misses) + len(cached_misses)
+        self.cached_miss_count += len(cached_misses)
+        return secrets
+
+    def items(self) -> list[tuple[str, str]]:
+        """
+        All stored ``(key, secret)`` pairs, in tracked order.
+
+        Returns:
+            list[tuple[str, str]]
+        """
+        return [(k, v) for k, v in self.get_many(self.keys).items() if v]
 
-        return _get_secret(key)
+    def iter_items(
+        self, keys: Optional[Iterable[str]] = None, window: int = PREFETCH_WINDOW
+    ) -> Iterator[tuple[str, str]]:
+        """
+        Stream ``(key, secret)`` pairs, looking up the next ``window`` secrets
+        in the background while the current one is being consumed. Pending
+        lookups are cancelled when the iterator is closed early.
+
+        Args:
+            keys (Optional[Iterable[str]]): The keys to look up. Defaults to all
+              tracked keys.
+            window (int): The maximum number of lookups to run ahead of the
+              consumer. Set to ``0`` to look up each secret only when requested.
 
-    def store_secret(self, key: str, secret: str):
+        Returns:
+            Iterator[tuple[str, str]]: The pairs, in the order of the given keys.
+              Untracked or missing secrets are skipped.
+        """
+        self._load_tracker()
+        tracked = self._tracker_key_set
+        keys = (k for k in (self._tracker_keys if keys is None else keys) if k in tracked)
+        if self.layout == StorageLayout.BUNDLED:
+            vault = self._load_vault()
+            yield from ((k, vault[k]) for k in keys if vault.get(k))
+            return
+
+        elif window < 1:
+            yield from ((k, v) for k in keys if (v := _get_secret(k)))
+            return
+
+        pool = ThreadPoolExecutor(max_workers=min(window, self.max_workers))
+        pending: deque[tuple[str, Future]] = deque()
+        try:
+            for key in keys:
+                pending.append((key, pool.submit(_get_secret, key)))
+                if len(pending) > window:
+                    key, future = pending.popleft()
+                    if secret := future.result():
+                        yield key, secret
+
+            while pending:
+                key, future = pending.popleft()
+                if secret := future.result():
+                    yield key, secret
+
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def store_secret(self, key: str, secret: str, metadata: Optional[dict] = None):
         """
         Add a new item to be tracked.
 
         Args:
             key (str): The new key for the item.
             secret (str): The value of the secret to store.
+            metadata (Optional[dict]): Public data to record alongside the secret.
         """
 
-        if key not in self.keys:
-            self._track([*self.keys, key])
+        self.store_secrets({key: secret}, metadata={key: metadata} if metadata else None)
 
-        _set_secret(key, secret)
+    def store_secrets(
+        self,
+        secrets: dict[str, str],
+        metadata: Optional[dict[str, dict]] = None,
+        namespaces: Optional[dict[str, dict[str, str]]] = None,
+    ):
+        """
+        Add many new items to be tracked, updating the tracker at most once.
+
+        Args:
+            secrets (dict[str, str]): The secret values by key.
+            metadata (Optional[dict[str, dict]]): Public data to record
+              alongside the secrets, by key.
+            namespaces (Optional[dict[str, dict[str, str]]]): Keys to record
+              in namespaces, by their name within each namespace.
+        """
+        if not secrets:
+            return
+
+        try:
+            self._store_secrets(secrets, metadata=metadata, namespaces=namespaces)
+        finally:
+            for key in secrets:
+                self._misses.pop(key, None)
+
+    def _store_secrets(
+        self,
+        secrets: dict[str, str],
+        metadata: Optional[dict[str, dict]],
+        namespaces: Optional[dict[str, dict[str, str]]],
+    ):
+        if self.layout == StorageLayout.BUNDLED:
+            vault_update: dict[str, Optional[str]] = {k: v for k, v in secrets.items() if k and v}
+            self._track(
+                add=list(secrets),
+                metadata=metadata,
+                namespaces=namespaces,
+                vault_update=vault_update,
+            )
+            return
+
+        if (
+            metadata
+            or any(k not in self._tracker_key_set for k in secrets)
+            or any(
+                self.get_namespace(namespace).get(n) != k
+                for namespace, keys in (namespaces or {}).items()
+                for n, k in keys.items()
+            )
+        ):
+            self._track(add=list(secrets), metadata=metadata, namespaces=namespaces)
+
+        items = list(secrets.items())
+        _map_concurrently(lambda item: _set_secret(*item), items, self.max_workers)
 
     def delete_secret(self, key: str):
-        if key in self.keys:
-            self._track([k for k in self.keys if k != key])
+        if self.layout == StorageLayout.BUNDLED:
+            did_delete = key in self._load_vault()
+            self._track(remove=[key], vault_update={key: None})
+            return did_delete
+
+        if key in self:
+            self._track(remove=[key])
 
         return _delete_secret(key)
 
-    def delete_all(self):
-        for key in self.keys:
-            _delete_secret(key)
+    def delete_all(self) -> DeleteSummary:
+        """
+        Delete every tracked item concurrently, then update the tracker once
+        so that only the items that failed to delete remain tracked.
 
-    def _track(self, new_keys: list[str]):
-        self._store_public_data(self._tracker_key, new_keys)
+        Returns:
+            :class:`~ape_keyring.storage.DeleteSummary`
+        """
+        keys = list(self.keys)
+        if self.layout == StorageLayout.BUNDLED:
+            vault = self._load_vault()
+            self._track(remove=keys, vault_update={k: None for k in keys})
+            return DeleteSummary(
+                deleted=[k for k in keys if k in vault],
+                missing=[k for k in keys if k not in vault],
+                failed={},
+            )
+
+        def delete(key: str) -> Optional[Exception]:
+            try:
+                if _delete_secret(key):
+                    return None
+
+                # Some backends fail to delete with the same error as for a missing item.
+                elif _get_secret(key) is None:
+                    return KeyError(key)
+
+                return PasswordDeleteError("Secret still exists after deleting it.")
+
+            except Exception as err:
+                return err
+
+        results = _map_concurrently(delete, keys, self.max_workers)
+        summary = DeleteSummary(deleted=[], missing=[], failed={})
+        for key, err in zip(keys, results):
+            if err is None:
+                summary.deleted.append(key)
+            elif isinstance(err, KeyError):
+                summary.missing.append(key)
+            else:
+                summary.failed[key] = str(err) or type(err).__name__
+
+        # Keys added by other processes in the meantime stay tracked.
+        self._track(remove=summary.deleted + summary.missing)
+        return summary
+
+    def migrate(self, layout: StorageLayout):
+        """
+        Move all secrets to the given layout. The new layout is written
+        before the old entries are removed, so an interrupted migration
+        leaves duplicates rather than losing secrets.
 
-    def _store_public_data(self, key: str, value: Any):
-        self.data_folder.mkdir(exist_ok=True, parents=True)
-        data = {**dict(self.plugin_data), key: value}
-        if self.data_file_path.exists():
-            self.data_file_path.unlink()
+        Args:
+            layout (:class:`~ape_keyring.storage.StorageLayout`): The new layout.
+        """
+        layout = StorageLayout(layout)
+        if layout == self.layout:
+            return
+
+        secrets: dict[str, str] = {}
+
+        def update(data: dict):
+            found = self.get_many(self.keys, use_miss_cache=False)
+            secrets.update({k: v for k, v in found.items() if v})
+            if layout == StorageLayout.BUNDLED:
+                self._write_vault(data, secrets)
+            else:
+                items = list(secrets.items())
+                _map_concurrently(lambda item: _set_secret(*item), items, self.max_workers)
+
+            data[self.layout_key] = layout.value
 
-        self.data_file_path.write_text(json.dumps(data))
+        self._update_public_data(update)
+
+        # Clean up the old layout's entries.
+        if layout == StorageLayout.BUNDLED:
+            _map_concurrently(_delete_secret, list(secrets), self.max_workers)
+        else:
+            _delete_secret(self.vault_key)
+            self._vault = None
+
+    def set_tracker_format(self, tracker_format: TrackerFormat):
+        """
+        Change how the tracker file is written. Switching to ``journal``
+        keeps the current file as the snapshot that the journal applies to;
+        switching back folds the journal into it.
+
+        Args:
+            tracker_format (:class:`~ape_keyring.storage.TrackerFormat`): The format.
+        """
+        tracker_format = TrackerFormat(tracker_format)
+
+        def update(data: dict):
+            data[TRACKER_FORMAT_KEY] = tracker_format.value
+
+        self._update_public_data(update)
+
+    def compact(self):
+        """
+        Fold the journal into the tracker file, when using the ``journal``
+        tracker format.
+        """
+        self.data_folder.mkdir(exist_ok=True, parents=True)
+        with file_lock(self.lock_file_path, self.lock_timeout):
+            self._load_tracker(force=True)
+            if self._tracker_data.get(TRACKER_FORMAT_KEY) == TrackerFormat.JOURNAL:
+                with stats.measure("tracker.compact"):
+                    self._write_snapshot(dict(self._tracker_data))
+
+    def _get_many(self, keys: list[str]) -> list[Optional[str]]:
+        if self.layout == StorageLayout.BUNDLED:
+            vault = self._load_vault()
+            return [vault.get(k) for k in keys]
+
+        return _map_concurrently(_get_secret, keys, self.max_workers)
+
+    def _load_vault(self) -> dict[str, str]:
+        revision = self._tracker_data.get(self.vault_revision_key)
+        if self._vault is None or self._vault_revision != revision:
+            self._vault = json.loads(_get_secret(self.vault_key) or "{}")
+            self._vault_revision = revision
+
+        return self._vault
+
+    def _write_vault(self, data: dict, vault: dict[str, str]):
+        if vault:
+            _set_secret(self.vault_key, json.dumps(vault))
+        else:
+            _delete_secret(self.vault_key)
+
+        data[self.vault_revision_key] = data.get(self.vault_revision_key, 0) + 1
+        self._vault = vault
+        self._vault_revision = data[self.vault_revision_key]
+
+    def _track(
+        self,
+        add: Iterable[str] = (),
+        remove: Iterable[str] = (),
+        metadata: Optional[dict[str, dict]] = None,
+        namespaces: Optional[dict[str, dict[str, str]]] = None,
+        vault_update: Optional[dict[str, Optional[str]]] = None,
+    ):
+        to_add = list(add)
+        to_remove = set(remove)
+
+        def update(data: dict):
+            if vault_update is not None:
+                # Read-modify-write the vault while holding the tracker lock.
+                self._vault = None
+                vault = dict(self._load_vault())
+                for key, secret in vault_update.items():
+                    if secret is None:
+                        vault.pop(key, None)
+                    else:
+                        vault[key] = secret
+
+                self._write_vault(data, vault)
+
+            keys = [k for k in data.get(self._tracker_key, []) if k not in to_remove]
+            existing = set(keys)
+            for key in to_add:
+                if key not in existing:
+                    keys.append(key)
+                    existing.add(key)
+
+            data[self._tracker_key] = keys
+            all_metadata = {
+                k: v for k, v in data.get(self.metadata_key, {}).items() if k not in to_remove
+            }
+            for key, values in (metadata or {}).items():
+                all_metadata[key] = {**all_metadata.get(key, {}), **values}
+
+            if all_metadata or self.metadata_key in data:
+                data[self.metadata_key] = all_metadata
+
+            # Only copy the namespaces that change.
+            index = self._get_namespace_index()
+            changed = {index[k] for k in to_remove if k in index}
+            changed.update(namespaces or {})
+            if changed or namespaces is not None:
+                all_namespaces = dict(data.get(self.namespaces_key, {}))
+                for namespace in changed:
+                    namespace_keys = {
+                        n: k
+                        for n, k in all_namespaces.get(namespace, {}).items()
+                        if k not in to_remove
+                    }
+                    namespace_keys.update((namespaces or {}).get(namespace, {}))
+                    if namespace_keys:
+                        all_namespaces[namespace] = namespace_keys
+                    else:
+                        all_namespaces.pop(namespace, None)
+
+                data[self.namespaces_key] = all_namespaces
+
+        self._update_public_data(update)
+
+    def _get_namespace_index(self) -> dict[str, str]:
+        if self._namespace_index is None:
+            self._namespace_index = {
+                k: namespace
+                for namespace, keys in self._tracker_data.get(self.namespaces_key, {}).items()
+                for k in keys.values()
+            }
+
+        return self._namespace_index
+
+    def _update_public_data(self, update: Callable[[dict], None]):
+        """
+        Read, modify and re-write the tracker while holding the cross-process
+        tracker lock. Using the ``journal`` format, only the changes are
+        appended; otherwise, the tracker file is atomically re-written.
+        """
+        self.data_folder.mkdir(exist_ok=True, parents=True)
+        with file_lock(self.lock_file_path, self.lock_timeout):
+            # Another process may have written since we last looked.
+            self._load_tracker(force=True)
+            previous = self._tracker_data
+            data = dict(previous)
+            update(data)
+            if not self._can_append(previous, data):
+                self._write_snapshot(data)
+                return
+
+            if ops := diff_tracker(previous, data):
+                self._journal_offset = append_journal(
+                    self.journal_file_path, self._journal_offset, ops
+                )
+
+            snapshot_signature = (self._tracker_signature or (None, None))[0]
+            journal_signature = get_file_signature(self.journal_file_path)
+            self._cache_tracker(data, (snapshot_signature, journal_signature))
+            if self._journal_offset > self.journal_compact_size:
+                self._compact_in_background()
+
+    def _can_append(self, previous: dict, data: dict) -> bool:
+        return (
+            previous.get(TRACKER_FORMAT_KEY) == TrackerFormat.JOURNAL
+            and data.get(TRACKER_FORMAT_KEY) == TrackerFormat.JOURNAL
+            and self._journal_offset > 0
+            and self._journal_generation == previous.get(TRACKER_GENERATION_KEY)
+        )
+
+    def _write_snapshot(self, data: dict):
+        # Must hold the tracker lock.
+        is_journal = data.get(TRACKER_FORMAT_KEY) == TrackerFormat.JOURNAL
+        if is_journal:
+            # Invalidates the current journal, even if writing the new one fails.
+            data[TRACKER_GENERATION_KEY] = data.get(TRACKER_GENERATION_KEY, 0) + 1
+
+        with stats.measure("tracker.write"):
+            atomic_write(self.data_file_path, json.dumps(data))
+
+        if is_journal:
+            header = journal_header(data[TRACKER_GENERATION_KEY])
+            atomic_write(self.journal_file_path, header)
+            self._journal_offset = len(header.encode())
+            self._journal_generation = data[TRACKER_GENERATION_KEY]
+
+        else:
+            self.journal_file_path.unlink(missing_ok=True)
+            self._journal_offset = 0
+            self._journal_generation = None
+
+        signature = (
+            get_file_signature(self.data_file_path),
+            get_file_signature(self.journal_file_path),
+        )
+        self._cache_tracker(data, signature)
+
+    def _compact_in_background(self):
+        if self._compaction is not None and self._compaction.is_alive():
+            return
+
+        # Use a separate instance so this one's cache is never changed underneath it.
+        storage = SecretStorage(self._tracker_key, lock_timeout=self.lock_timeout)
+        self._compaction = threading.Thread(
+            target=storage.compact, name="ape-keyring-compact", daemon=True
+        )
+        self._compaction.start()
+
+    def _load_tracker(self, force: bool = False):
+        snapshot_signature = get_file_signature(self.data_file_path)
+        journal_signature = get_file_signature(self.journal_file_path)
+        cached_signature = self._tracker_signature or (None, None)
+        if not force and (snapshot_signature, journal_signature) == cached_signature:
+            # Nothing changed on disk since the last read.
+            return
+
+        # Secrets may have been stored by another process.
+        self._misses.clear()
+
+        if (
+            snapshot_signature is not None
+            and snapshot_signature == cached_signature[0]
+            and _is_appended(cached_signature[1], journal_signature, self._journal_offset)
+        ):
+            # Only the journal grew; replay just the new records.
+            data = dict(self._tracker_data)
+            offset, generation = self._journal_offset, self._journal_generation
+
+        else:
+            data = {}
+            offset, generation = 0, None
+            if snapshot_signature is not None:
+                try:
+                    snapshot_signature, data = _read_tracker(self.data_file_path)
+                except FileNotFoundError:
+                    snapshot_signature = None
+
+        if data.get(TRACKER_FORMAT_KEY) == TrackerFormat.JOURNAL:
+            try:
+                journal_signature, records, offset = read_journal(self.journal_file_path, offset)
+            except FileNotFoundError:
+                journal_signature, records, offset = None, [], 0
+
+            generation = apply_journal(data, records, generation)
+
+        self._journal_offset = offset
+        self._journal_generation = generation
+        self._cache_tracker(data, (snapshot_signature, journal_signature))
+
+    def _cache_tracker(self, data: dict, signature: Optional[tuple]):
+        self._tracker_data = data
+        self._tracker_keys = list(data.get(self._tracker_key, []))
+        self._tracker_key_set = set(self._tracker_keys)
+        self._tracker_metadata = data.get(self.metadata_key, {})
+        self._metadata_indexes = {}
+        self._namespace_index = None
+        self._tracker_signature = signature
 
 
 account_storage = SecretStorage(ACCOUNTS_TRACKER_KEY)
@@ -125,6 +879,33 @@ secret_storage = SecretStorage(SECRETS_TRACKER_KEY)
 """A storage class for storing secrets."""
 
 
+@timed("tracker.read")
+def _read_tracker(path: Path) -> tuple[tuple, dict]:
+    with open(path) as file:
+        # Use the signature of the opened file in case it was replaced meanwhile.
+        signature = _fstat_signature(path, file.fileno())
+        return signature, json.loads(file.read() or "{}")
+
+
+def _fstat_signature(path: Path, file_descriptor: int) -> tuple:
+    stat = os.fstat(file_descriptor)
+    return str(path), stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def _is_appended(old: Optional[tuple], new: Optional[tuple], offset: int) -> bool:
+    # Whether the same journal file still contains everything already read.
+    return old is not None and new is not None and old[:2] == new[:2] and new[2] >= offset
+
+
+def _map_concurrently(func: Callable[[_T], _R], items: list[_T], max_workers: int) -> list[_R]:
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        return list(pool.map(func, items))
+
+
+@timed("backend.get")
 def _get_secret(key: str) -> Optional[str]:
     try:
         return keyring.get_password(SERVICE_NAME, key)
@@ -132,6 +913,7 @@ def _get_secret(key: str) -> Optional[str]:
         return None
 
 
+@timed("backend.set")
 def _set_secret(key: str, secret: str):
     if not key or not secret:
         return
@@ -139,6 +921,7 @@ def _set_secret(key: str, secret: str):
     keyring.set_password(SERVICE_NAME, key, secret)
 
 
+@timed("backend.delete")
 def _delete_secret(key: str):
     if not key:
         return False
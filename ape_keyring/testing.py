@@ -1,15 +1,42 @@
+import json
+import mmap
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
 from keyring.backend import KeyringBackend
 
 from ape_keyring.storage import ACCOUNTS_TRACKER_KEY, SECRETS_TRACKER_KEY, SERVICE_NAME
+from ape_keyring.utils import file_lock
+
+SHARED_FILE_LOCK_TIMEOUT = 10.0
 
 
 class EphemeralBackend(KeyringBackend):
     """
     A keyring backend that requires Ape and is in-memory only,
-    for testing purposes.
+    for testing purposes. Optionally, share the storage between
+    processes (such as ``pytest-xdist`` workers) using a memory-mapped file.
     """
 
-    _storage = {ACCOUNTS_TRACKER_KEY: "", SECRETS_TRACKER_KEY: ""}
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Args:
+            path (Optional[Path]): A file to share the storage through.
+              Defaults to storing in this instance only.
+        """
+        super().__init__()
+        self._lock = threading.RLock()
+        self._path = Path(path) if path else None
+        self._storage = {ACCOUNTS_TRACKER_KEY: "", SECRETS_TRACKER_KEY: ""}
+        if self._path is not None:
+            with self._transaction() as storage:
+                for key, value in self._storage.items():
+                    storage.setdefault(key, value)
 
     @property
     def priority(cls):
@@ -17,21 +44,88 @@ class EphemeralBackend(KeyringBackend):
 
     def set_password(self, servicename, username, password):
         _require_ape(servicename, "Saving non-ape secret.")
-        self._storage[username] = password
+        with self._transaction() as storage:
+            storage[username] = password
 
     def get_password(self, servicename, username):
         _require_ape(servicename, "Requesting non-ape secret.")
-
-        if username in self._storage:
-            return self._storage[username]
+        with self._transaction(write=False) as storage:
+            if username in storage:
+                return storage[username]
 
     def delete_password(self, servicename, username):
         _require_ape(servicename, "Deleting non-ape secret.")
+        with self._transaction() as storage:
+            if username not in storage:
+                raise AssertionError(f"Deleting non-stored username '{username}'.")
+
+            del storage[username]
+
+    @contextmanager
+    def _transaction(self, write: bool = True) -> Iterator[dict]:
+        with self._lock:
+            if self._path is None:
+                yield self._storage
+                return
+
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with file_lock(self._path.with_suffix(".lock"), SHARED_FILE_LOCK_TIMEOUT):
+                storage = self._read_shared()
+                yield storage
+                if write:
+                    self._write_shared(storage)
+
+    def _read_shared(self) -> dict:
+        assert self._path is not None
+        if not self._path.is_file() or not self._path.stat().st_size:
+            return {}
+
+        with open(self._path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return json.loads(mapped[:])
+
+    def _write_shared(self, storage: dict):
+        assert self._path is not None
+        content = json.dumps(storage).encode()
+        with open(self._path, "a+b") as file:
+            file.truncate(len(content))
+            with mmap.mmap(file.fileno(), len(content)) as mapped:
+                mapped[:] = content
+                mapped.flush()
+
 
-        if username not in self._storage:
-            raise AssertionError(f"Deleting non-stored username '{username}'.")
+class LatencyBackend(EphemeralBackend):
+    """
+    An in-memory keyring backend that sleeps on every call and counts
+    them, for simulating slow backends (such as D-Bus) in benchmarks.
+    """
+
+    def __init__(self, latency: float = 0.001, path: Optional[Path] = None):
+        """
+        Args:
+            latency (float): Seconds each backend call takes.
+            path (Optional[Path]): A file to share the storage through.
+        """
+        super().__init__(path=path)
+        self.latency = latency
+        self.calls: Counter = Counter()
+
+    def set_password(self, servicename, username, password):
+        self._wait("set")
+        super().set_password(servicename, username, password)
+
+    def get_password(self, servicename, username):
+        self._wait("get")
+        return super().get_password(servicename, username)
+
+    def delete_password(self, servicename, username):
+        self._wait("delete")
+        super().delete_password(servicename, username)
 
-        del self._storage[username]
+    def _wait(self, operation: str):
+        self.calls[operation] += 1
+        if self.latency:
+            time.sleep(self.latency)
 
 
 def _require_ape(service_name: str, msg: str):
@@ -1,10 +1,53 @@
-from typing import Any, Optional
+import asyncio
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+from typing import Any, Optional, TypeVar
 
 import click
+from ape.api import TransactionAPI
 from ape.logging import logger
 from eth_account import Account as EthAccount
 from eth_account.signers.local import LocalAccount
+from eth_keys.datatypes import PrivateKey
 from eth_utils import to_bytes
+from pydantic import BaseModel
+
+from ape_keyring.exceptions import TrackerLockError
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+_T = TypeVar("_T")
+_executors: dict[int, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+_transaction_fields: dict[type, list[tuple[str, str]]] = {}
+
+
+def get_file_signature(path: Path) -> Optional[tuple]:
+    """
+    Identify the current version of a file without reading it.
+
+    Returns:
+        Optional[tuple]: ``None`` when the file does not exist.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+
+    return str(path), stat.st_ino, stat.st_size, stat.st_mtime_ns
 
 
 def get_eth_account(private_key: str) -> Optional[LocalAccount]:
@@ -15,5 +58,163 @@ def get_eth_account(private_key: str) -> Optional[LocalAccount]:
         return None
 
 
+def parse_private_key(private_key: str) -> PrivateKey:
+    """
+    Parse a hex private key into a signing-key object, which derives
+    the public key once so signing with it never has to again.
+    """
+    return PrivateKey(to_bytes(hexstr=private_key))
+
+
+def get_transaction_fields(txn: TransactionAPI) -> dict:
+    """
+    Get the fields to sign, read straight from the transaction's typed
+    values instead of serializing the transaction to JSON and back.
+
+    Args:
+        txn (:class:`~ape.api.transactions.TransactionAPI`): The transaction.
+
+    Returns:
+        dict: The fields, keyed by their RPC names.
+    """
+    txn_type = type(txn)
+    if txn_type not in _transaction_fields:
+        _transaction_fields[txn_type] = [
+            (name, field.alias or name)
+            for name, field in txn_type.model_fields.items()
+            if not field.exclude
+        ]
+
+    fields = {}
+    for name, key in _transaction_fields[txn_type]:
+        value = getattr(txn, name)
+        if value is None:
+            # Like the models' own serialization.
+            continue
+
+        elif isinstance(value, list) and value and isinstance(value[0], BaseModel):
+            # Such as access lists, which are small.
+            value = [v.model_dump(by_alias=True, mode="json") for v in value]
+
+        fields[key] = value
+
+    return fields
+
+
+def derive_addresses(private_keys: list[Optional[str]]) -> list[Optional[str]]:
+    """
+    Derive the addresses of the given private keys. Top-level so it can
+    run in a worker process.
+    """
+    addresses: list[Optional[str]] = []
+    for private_key in private_keys:
+        eth_account = get_eth_account(private_key) if private_key else None
+        addresses.append(eth_account.address if eth_account else None)
+
+    return addresses
+
+
+def get_process_pool_context():
+    """
+    The multiprocessing context to use for CPU-bound work, or ``None``
+    when it should run in-process instead. Only ``fork`` is used, as spawned
+    workers would have to re-import Ape and its plugins.
+    """
+    if sys.platform.startswith("linux"):
+        return multiprocessing.get_context("fork")
+
+    return None
+
+
 def agree_to_sign(message: Any, message_type_name: str) -> bool:
     return click.confirm(f"Sign {message_type_name}: {message}")
+
+
+def agree_to_sign_many(messages: list[Any], message_type_name: str) -> bool:
+    details = "\n".join(f"  {message}" for message in messages)
+    return click.confirm(f"Sign {len(messages)} {message_type_name}s:\n{details}\n")
+
+
+async def run_in_executor(func: Callable[..., _T], *args, max_workers: int, **kwargs) -> _T:
+    """
+    Run a blocking function, such as a keyring lookup or signing, without
+    blocking the event loop. Calls sharing the same ``max_workers`` share
+    a thread pool, so at most that many of them run at once.
+    """
+    with _executors_lock:
+        if max_workers not in _executors:
+            _executors[max_workers] = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="ape-keyring"
+            )
+
+        executor = _executors[max_workers]
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
+
+
+@contextmanager
+def file_lock(path: Path, timeout: float) -> Iterator[None]:
+    """
+    Hold an advisory, cross-process lock on the given lock file,
+    waiting at most ``timeout`` seconds for it.
+    """
+    deadline = time.monotonic() + timeout
+    with open(path, "a+") as lock_file:
+        file_descriptor = lock_file.fileno()
+        while True:
+            try:
+                _lock(file_descriptor)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    raise TrackerLockError(path, timeout)
+
+                time.sleep(0.01)
+
+        try:
+            yield
+        finally:
+            _unlock(file_descriptor)
+
+
+def _lock(file_descriptor: int):
+    if fcntl is not None:
+        fcntl.flock(file_descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    else:
+        msvcrt.locking(file_descriptor, msvcrt.LK_NBLCK, 1)
+
+
+def _unlock(file_descriptor: int):
+    if fcntl is not None:
+        fcntl.flock(file_descriptor, fcntl.LOCK_UN)
+    else:
+        msvcrt.locking(file_descriptor, msvcrt.LK_UNLCK, 1)
+
+
+def atomic_write(path: Path, text: str):
+    """
+    Replace a file's contents so readers never see a partial write.
+    """
+    file_descriptor, temp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(file_descriptor, "w") as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temp_path, path)
+
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+    if fcntl is not None:
+        # Persist the rename itself.
+        directory_descriptor = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(directory_descriptor)
+        finally:
+            os.close(directory_descriptor)
@@ -0,0 +1,101 @@
+import os
+
+import ape
+import keyring
+import pytest
+from ape._cli import cli as root_cli
+from click.testing import CliRunner
+from eth_utils import to_checksum_address
+
+from ape_keyring._secrets import get_secret_manager
+from ape_keyring.storage import SecretStorage
+from ape_keyring.testing import LatencyBackend
+
+# Configure using e.g. `APE_KEYRING_BENCHMARK_SIZES=10,100 APE_KEYRING_BENCHMARK_LATENCY=0.02`.
+SIZES = [int(n) for n in os.getenv("APE_KEYRING_BENCHMARK_SIZES", "10,100,1000,10000").split(",")]
+LATENCY = float(os.getenv("APE_KEYRING_BENCHMARK_LATENCY", "0.001"))
+
+
+def pytest_generate_tests(metafunc):
+    if "size" in metafunc.fixturenames:
+        metafunc.parametrize("size", SIZES, scope="session")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def config():
+    with ape.config.isolate_data_folder():
+        yield ape.config
+
+
+@pytest.fixture(scope="session")
+def backend():
+    backend = LatencyBackend(latency=LATENCY)
+    keyring.set_keyring(backend)
+    return backend
+
+
+@pytest.fixture(scope="session")
+def populate(backend):
+    def populate(storage: SecretStorage, keys: list[str], metadata=None, namespaces=None):
+        # Bypass the API (and latency) so large sizes are quick to set up.
+        for key in keys:
+            backend._storage[key] = f"{key}-value"
+
+        # Replace anything left over from previous runs.
+        storage._track(remove=storage.keys)
+        storage._track(add=keys, metadata=metadata, namespaces=namespaces)
+
+    return populate
+
+
+@pytest.fixture(scope="session")
+def storage(size, populate):
+    storage = SecretStorage(f"benchmark-secrets-{size}")
+    populate(storage, [f"SECRET_{idx}" for idx in range(size)])
+    return storage
+
+
+@pytest.fixture(scope="session")
+def secret_manager(size, populate):
+    storage = SecretStorage(f"benchmark-managed-secrets-{size}")
+    manager = get_secret_manager(ape.project.path, storage=storage)
+    project_keys = {
+        f"PROJECT_SECRET_{idx}": f"PROJECT_SECRET_{idx}{manager._project_key}"
+        for idx in range(size // 2)
+    }
+    populate(
+        storage,
+        [f"SECRET_{idx}" for idx in range(size)] + list(project_keys.values()),
+        namespaces={manager.project_name: project_keys},
+    )
+    return manager
+
+
+@pytest.fixture(scope="session")
+def container(size, populate):
+    container = ape.accounts.containers["keyring"]
+    container.storage = SecretStorage(f"benchmark-accounts-{size}")
+    aliases = [f"account-{idx}" for idx in range(size)]
+    metadata = {
+        alias: {"address": to_checksum_address((idx + 1).to_bytes(20, "big"))}
+        for idx, alias in enumerate(aliases)
+    }
+    populate(container.storage, aliases, metadata=metadata)
+    return container
+
+
+@pytest.fixture
+def calls(backend, benchmark):
+    backend.calls.clear()
+    yield backend.calls
+    benchmark.extra_info["backend_calls"] = dict(backend.calls)
+
+
+@pytest.fixture
+def runner():
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def cli():
+    return root_cli
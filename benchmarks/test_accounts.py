@@ -0,0 +1,11 @@
+def test_list(benchmark, cli, runner, container, size, calls):
+    result = benchmark.pedantic(
+        runner.invoke, args=(cli, ("keyring", "accounts", "list")), rounds=3
+    )
+    assert result.exit_code == 0, result.output
+    assert f"Found {size} account" in result.output
+
+
+def test_load_by_address(benchmark, container, calls):
+    address = container.storage.get_metadata("account-0")["address"]
+    assert benchmark(container.__getitem__, address).alias == "account-0"
@@ -0,0 +1,42 @@
+import os
+
+import pytest
+
+from ape_keyring.config import KeyringConfig
+
+
+def test_partition(benchmark, secret_manager, size):
+    result = benchmark(secret_manager.partition)
+    assert len(result.global_keys) == size
+
+
+def test_project_keys(benchmark, secret_manager, size):
+    assert len(benchmark(lambda: secret_manager.project_keys)) == size // 2
+
+
+def test_global_keys(benchmark, secret_manager, size):
+    assert len(benchmark(lambda: secret_manager.global_keys)) == size
+
+
+@pytest.mark.parametrize("env_var_sync", ("eager", "lazy", "background"))
+def test_set_environment_variables(benchmark, secret_manager, calls, monkeypatch, env_var_sync):
+    config = KeyringConfig(set_env_vars=True, env_var_sync=env_var_sync)
+    monkeypatch.setattr(type(secret_manager), "config", property(lambda _: config))
+
+    env_var_names = list(secret_manager._get_env_var_keys())
+
+    def reset():
+        # Start each round without the variables, or the previous round's shim.
+        secret_manager.ensure_environment_variables()
+        for name in env_var_names:
+            os.environ.pop(name, None)
+
+    def sync():
+        secret_manager.set_environment_variables()
+        # Let the deferred modes sync in full, as when the environment is enumerated.
+        secret_manager.ensure_environment_variables()
+
+    try:
+        benchmark.pedantic(sync, setup=reset, rounds=3)
+    finally:
+        reset()
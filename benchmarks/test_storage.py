@@ -0,0 +1,24 @@
+def test_get_secret(benchmark, storage, calls):
+    assert benchmark(storage.get_secret, "SECRET_0") == "SECRET_0-value"
+
+
+def test_get_missing_secret(benchmark, storage, calls):
+    assert benchmark(storage.get_secret, "NOT_A_SECRET") is None
+
+
+def test_store_and_delete_secret(benchmark, storage, calls):
+    def store_and_delete():
+        storage.store_secret("NEW_SECRET", "new-value")
+        storage.delete_secret("NEW_SECRET")
+
+    benchmark(store_and_delete)
+
+
+def test_iter(benchmark, storage, size, calls):
+    result = benchmark.pedantic(list, args=(storage,), rounds=3)
+    assert len(result) == size
+
+
+def test_get_many(benchmark, storage, size, calls):
+    result = benchmark.pedantic(storage.get_many, args=(storage.keys,), rounds=3)
+    assert len(result) == size
@@ -49,6 +49,28 @@ def accounts():
     return ape.accounts
 
 
+@pytest.fixture(scope="session")
+def networks():
+    return ape.networks
+
+
+@pytest.fixture
+def transactions(networks):
+    ecosystem = networks.ethereum
+    return [
+        ecosystem.create_transaction(
+            chain_id=1337,
+            nonce=nonce,
+            gas_limit=21000,
+            max_fee=10,
+            max_priority_fee=1,
+            value=1,
+            receiver="0x1212121212121212121212121212121212121212",
+        )
+        for nonce in range(3)
+    ]
+
+
 @pytest.fixture
 def runner():
     return CliRunner()
@@ -1,6 +1,25 @@
+import asyncio
+import threading
+import time
+
 import pytest
+from ape.exceptions import AccountsError
+from ape.types import TransactionSignature
+from ape_ethereum.transactions import (
+    AccessListTransaction,
+    DynamicFeeTransaction,
+    SetCodeTransaction,
+    SharedBlobTransaction,
+    StaticFeeTransaction,
+)
 from eth_account import Account
 from eth_account.messages import encode_defunct
+from eth_utils import to_bytes
+
+import ape_keyring.accounts
+from ape_keyring._key_cache import KeyCache, key_cache
+from ape_keyring.config import KeyCacheConfig, RateLimitConfig, SigningPolicyConfig
+from ape_keyring.exceptions import MissingSecretError, SigningPolicyError
 
 
 @pytest.fixture
@@ -54,3 +73,429 @@ def test_delete(cli, runner, keyring_account):
     # Verify account is NOT listed in 'list' command
     result = runner.invoke(cli, ("keyring", "accounts", "list"))
     assert keyring_account.alias not in result.output
+
+
+@pytest.fixture
+def key_cache_config(config, monkeypatch):
+    plugin_config = config.get_config("keyring")
+    cache_config = KeyCacheConfig(enabled=True, max_uses=2)
+    monkeypatch.setattr(plugin_config, "key_cache", cache_config)
+    yield cache_config
+    key_cache.clear()
+
+
+def test_key_cache(keyring_account, key_cache_config, eip191_message, monkeypatch):
+    lookups = []
+    get_secret = keyring_account.storage.get_secret
+
+    def count_lookups(key):
+        lookups.append(key)
+        return get_secret(key)
+
+    monkeypatch.setattr(keyring_account.storage, "get_secret", count_lookups)
+    keyring_account.set_autosign(True)
+    try:
+        for _ in range(3):
+            keyring_account.sign_message(eip191_message)
+    finally:
+        keyring_account.set_autosign(False)
+
+    # The key is re-loaded once max_uses is reached.
+    assert len(lookups) == 2
+
+
+def test_key_cache_cleared_on_delete(container, keyring_account, key_cache_config):
+    cache_key = (container.storage, keyring_account.alias, keyring_account.address)
+    keyring_account.set_autosign(True)
+    keyring_account.sign_message("Hello Test")
+    assert cache_key in key_cache
+
+    container.delete_account(keyring_account.alias)
+    assert cache_key not in key_cache
+
+
+def test_key_cache_recreated_account(container, accounts, keyring_account, key_cache_config):
+    alias = keyring_account.alias
+    other_account = accounts.test_accounts[1]
+    keyring_account.set_autosign(True)
+    keyring_account.sign_message("Hello Test")
+
+    # Simulate re-creating the account in another process.
+    container.storage.store_secret(
+        alias, other_account.private_key, metadata={"address": other_account.address}
+    )
+    account = container.load(alias)
+    account.set_autosign(True)
+    signature = account.sign_message("Hello Test")
+
+    message = encode_defunct(text="Hello Test")
+    assert Account.recover_message(message, signature=signature.encode_rsv()) == (
+        other_account.address
+    )
+
+
+def test_key_cache_wiped_on_expiry():
+    cache = KeyCache()
+    cache.get("short", lambda: "short-key", ttl=0.5)
+    cached = cache._keys["short"]
+    cache.get("once", lambda: "once-key", max_uses=1)
+    # Wiped without another access.
+    assert "once" not in cache._keys
+    time.sleep(1)
+    assert "short" not in cache._keys
+    assert cached._key == bytearray()
+
+
+def test_key_cache_load_does_not_block():
+    cache = KeyCache()
+    loading = threading.Event()
+    unlocked = threading.Event()
+
+    def slow_load():
+        # Such as waiting on an unlock prompt.
+        loading.set()
+        unlocked.wait(10)
+        return "slow-key"
+
+    thread = threading.Thread(target=cache.get, args=("slow", slow_load))
+    thread.start()
+    try:
+        loading.wait(10)
+        assert cache.get("fast", lambda: "fast-key") == "fast-key"
+        assert thread.is_alive()
+    finally:
+        unlocked.set()
+        thread.join()
+
+    assert cache.get("slow", lambda: "reloaded") == "slow-key"
+
+
+def test_address_from_metadata(container, keyring_account, address, monkeypatch):
+    assert container.storage.get_metadata(keyring_account.alias) == {"address": address}
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Private key accessed.")
+
+    monkeypatch.setattr(container.storage, "get_secret", fail)
+    assert container.load(keyring_account.alias).address == address
+    assert container[address].alias == keyring_account.alias
+    assert address in container
+
+
+def test_address_backfilled(container, keyring_account, address):
+    # Simulate an account created before addresses were recorded.
+    container.storage._track(remove=[keyring_account.alias], add=[keyring_account.alias])
+    assert container.storage.get_metadata(keyring_account.alias) == {}
+
+    assert container[address].alias == keyring_account.alias
+    assert container.storage.get_metadata(keyring_account.alias) == {"address": address}
+
+
+@pytest.mark.parametrize("ordered", (False, True))
+def test_iter_addresses(container, accounts, keyring_account, ordered, monkeypatch):
+    # Use a chunk per account to derive them in worker processes.
+    monkeypatch.setattr(ape_keyring.accounts, "ADDRESS_DERIVATION_CHUNK_SIZE", 1)
+    other_account = accounts.test_accounts[1]
+    other_alias = f"{keyring_account.alias}-other"
+    container.create_account(other_alias, other_account.private_key)
+    expected = {keyring_account.alias: keyring_account.address, other_alias: other_account.address}
+    try:
+        # Simulate accounts created before addresses were recorded.
+        container.storage._track(remove=list(expected), add=list(expected))
+        actual = dict(container.iter_addresses(ordered=ordered))
+        recorded = {a: container.storage.get_metadata(a).get("address") for a in expected}
+    finally:
+        container.delete_account(other_alias)
+
+    assert actual == expected
+    assert recorded == expected
+
+
+class Confirmations(list):
+    agree = True
+
+    def __call__(self, messages, message_type_name):
+        self.append(messages)
+        return self.agree
+
+
+@pytest.fixture
+def confirmations(monkeypatch):
+    confirmations = Confirmations()
+    monkeypatch.setattr(ape_keyring.accounts, "agree_to_sign_many", confirmations)
+    return confirmations
+
+
+def test_sign_transactions(keyring_account, transactions, confirmations, monkeypatch):
+    lookups = []
+    get_secret = keyring_account.storage.get_secret
+
+    def count_lookups(key):
+        lookups.append(key)
+        return get_secret(key)
+
+    monkeypatch.setattr(keyring_account.storage, "get_secret", count_lookups)
+    signed = list(keyring_account.sign_transactions(transactions))
+
+    assert len(confirmations) == 1
+    assert len(lookups) == 1
+    assert [t.nonce for t in signed] == [0, 1, 2]
+    for txn in signed:
+        signer = Account.recover_transaction(txn.serialize_transaction())
+        assert signer == keyring_account.address
+
+
+def test_sign_transactions_declined(keyring_account, transactions, confirmations):
+    confirmations.agree = False
+    assert list(keyring_account.sign_transactions(transactions)) == []
+
+
+def test_async_sign(keyring_account, transactions, eip191_message):
+    async def sign_all():
+        return await asyncio.gather(
+            keyring_account.async_sign_message(eip191_message),
+            *(keyring_account.async_sign_transaction(t) for t in transactions),
+        )
+
+    keyring_account.set_autosign(True)
+    try:
+        signature, *signed = asyncio.run(sign_all())
+    finally:
+        keyring_account.set_autosign(False)
+
+    assert Account.recover_message(eip191_message, signature=signature.encode_rsv()) == (
+        keyring_account.address
+    )
+    for txn in signed:
+        signer = Account.recover_transaction(txn.serialize_transaction())
+        assert signer == keyring_account.address
+
+
+def test_create_accounts(container):
+    new_accounts = [Account.create() for _ in range(3)]
+    batch = [(f"batch-test-{idx}", a.key.hex()) for idx, a in enumerate(new_accounts)]
+    try:
+        actual = container.create_accounts(batch)
+        assert actual == {alias: a.address for (alias, _), a in zip(batch, new_accounts)}
+        for alias, _ in batch:
+            assert container.storage.get_metadata(alias) == {"address": actual[alias]}
+            assert container.load(alias).address == actual[alias]
+
+    finally:
+        for alias, _ in batch:
+            container.delete_account(alias)
+
+
+def test_create_accounts_invalid_key(container):
+    batch = [("batch-test-valid", Account.create().key.hex()), ("batch-test-invalid", "0x123")]
+    with pytest.raises(AccountsError, match="batch-test-invalid"):
+        container.create_accounts(batch)
+
+    # Nothing is stored.
+    assert all(alias not in container.storage for alias, _ in batch)
+
+
+def test_import_batch(cli, runner, container):
+    new_accounts = [Account.create() for _ in range(2)]
+    aliases = [f"batch-test-{idx}" for idx in range(len(new_accounts))]
+    lines = ["# alias,private_key", ""]
+    lines.extend(f"{alias},{a.key.hex()}" for alias, a in zip(aliases, new_accounts))
+    try:
+        result = runner.invoke(cli, ("keyring", "accounts", "import-batch"), input="\n".join(lines))
+        assert not result.exit_code, result.output
+        assert "Imported 2 accounts" in result.output
+        for alias, new_account in zip(aliases, new_accounts):
+            assert new_account.address in result.output
+            assert container.load(alias).address == new_account.address
+
+    finally:
+        for alias in aliases:
+            container.delete_account(alias)
+
+
+def test_import_batch_existing_alias(cli, runner, keyring_account):
+    line = f"{keyring_account.alias},{Account.create().key.hex()}"
+    result = runner.invoke(cli, ("keyring", "accounts", "import-batch"), input=line)
+    assert result.exit_code, result.output
+    assert f"'{keyring_account.alias}' already exists" in result.output
+
+
+RECEIVER = "0x1212121212121212121212121212121212121212"
+TRANSACTION_FIELDS = {
+    StaticFeeTransaction: {"gasPrice": 10},
+    AccessListTransaction: {
+        "gasPrice": 10,
+        "accessList": [{"address": RECEIVER, "storageKeys": [f"0x{'22' * 32}"]}],
+    },
+    DynamicFeeTransaction: {"maxFeePerGas": 10, "maxPriorityFeePerGas": 1},
+    SharedBlobTransaction: {
+        "maxFeePerGas": 10,
+        "maxPriorityFeePerGas": 1,
+        "maxFeePerBlobGas": 5,
+        "blobVersionedHashes": [f"0x01{'33' * 31}"],
+    },
+    SetCodeTransaction: {
+        "maxFeePerGas": 10,
+        "maxPriorityFeePerGas": 1,
+        "authorizationList": [
+            {
+                "chainId": 1337,
+                "address": RECEIVER,
+                "nonce": 0,
+                "yParity": 1,
+                "r": f"0x{'44' * 32}",
+                "s": f"0x{'55' * 32}",
+            }
+        ],
+    },
+}
+
+
+@pytest.mark.parametrize("txn_class", TRANSACTION_FIELDS)
+def test_sign_transaction_matches_json_fields(keyring_account, private_key, txn_class):
+    txn = txn_class(
+        chainId=1337,
+        nonce=3,
+        gas=50000,
+        to=RECEIVER,
+        value=1,
+        data="0x1234",
+        sender=keyring_account.address,
+        **TRANSACTION_FIELDS[txn_class],
+    )
+    keyring_account.set_autosign(True)
+    try:
+        expected = Account.sign_transaction(txn.model_dump(by_alias=True, mode="json"), private_key)
+    except Exception as err:
+        # Not supported by eth-account; the fast path must fail the same way.
+        with pytest.raises(type(err)):
+            keyring_account.sign_transaction(txn)
+
+        return
+
+    finally:
+        keyring_account.set_autosign(False)
+
+    keyring_account.set_autosign(True)
+    try:
+        signed = keyring_account.sign_transaction(txn)
+    finally:
+        keyring_account.set_autosign(False)
+
+    assert signed.signature == TransactionSignature(
+        v=expected.v, r=to_bytes(expected.r), s=to_bytes(expected.s)
+    )
+
+
+def test_signing_key_cached(keyring_account, key_cache_config, transactions, monkeypatch):
+    parses = []
+    parse_private_key = ape_keyring.accounts.parse_private_key
+
+    def count_parses(key):
+        parses.append(key)
+        return parse_private_key(key)
+
+    monkeypatch.setattr(ape_keyring.accounts, "parse_private_key", count_parses)
+    keyring_account.set_autosign(True)
+    try:
+        for txn in transactions[:2]:
+            keyring_account.sign_transaction(txn)
+    finally:
+        keyring_account.set_autosign(False)
+
+    assert len(parses) == 1
+
+
+def test_sign_transactions_key_cache_uses(
+    keyring_account, key_cache_config, transactions, confirmations, monkeypatch
+):
+    lookups = []
+    get_secret = keyring_account.storage.get_secret
+
+    def count_lookups(key):
+        lookups.append(key)
+        return get_secret(key)
+
+    monkeypatch.setattr(keyring_account.storage, "get_secret", count_lookups)
+    signed = list(keyring_account.sign_transactions(transactions))
+
+    # Each signature is a use, so the key is re-loaded once max_uses is reached.
+    assert len(signed) == 3
+    assert len(lookups) == 2
+
+
+@pytest.fixture
+def signing_policy(config, monkeypatch):
+    plugin_config = config.get_config("keyring")
+
+    def set_policy(**kwargs):
+        policy_config = SigningPolicyConfig(enabled=True, **kwargs)
+        monkeypatch.setattr(plugin_config, "signing_policy", policy_config)
+        return policy_config
+
+    return set_policy
+
+
+def test_signing_policy(keyring_account, transactions, signing_policy, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("Prompted to sign.")
+
+    monkeypatch.setattr(ape_keyring.accounts, "agree_to_sign", fail)
+    monkeypatch.setattr(ape_keyring.accounts, "agree_to_sign_many", fail)
+    signing_policy(allowed_receivers=[RECEIVER.lower()], max_value=1, chain_ids=[1337])
+
+    signed = keyring_account.sign_transaction(transactions[0])
+    assert Account.recover_transaction(signed.serialize_transaction()) == keyring_account.address
+    assert len(list(keyring_account.sign_transactions(transactions[1:]))) == 2
+
+
+@pytest.mark.parametrize(
+    "rules,match",
+    (
+        ({"allowed_receivers": [f"0x{'34' * 20}"]}, "Receiver"),
+        ({"max_value": 0}, "Value"),
+        ({"chain_ids": [1]}, "Chain ID"),
+    ),
+)
+def test_signing_policy_violation(keyring_account, transactions, signing_policy, rules, match):
+    signing_policy(**rules)
+    with pytest.raises(SigningPolicyError, match=match):
+        keyring_account.sign_transaction(transactions[0])
+
+    with pytest.raises(SigningPolicyError, match=match):
+        list(keyring_account.sign_transactions(transactions))
+
+
+def test_signing_policy_rate_limit(keyring_account, transactions, signing_policy, eip191_message):
+    signing_policy(rate_limits=[RateLimitConfig(max_signatures=2, window=60)])
+    keyring_account.sign_transaction(transactions[0])
+    keyring_account.sign_message(eip191_message)
+    with pytest.raises(SigningPolicyError, match="Rate limit"):
+        keyring_account.sign_transaction(transactions[1])
+
+    with pytest.raises(SigningPolicyError, match="Rate limit"):
+        keyring_account.sign_message(eip191_message)
+
+
+def test_signing_policy_requires_rules():
+    with pytest.raises(ValueError, match="requires at least one rule"):
+        SigningPolicyConfig(enabled=True)
+
+
+def test_signing_policy_failed_signature_not_counted(
+    keyring_account, transactions, signing_policy, monkeypatch
+):
+    signing_policy(rate_limits=[RateLimitConfig(max_signatures=1, window=60)])
+
+    def fail(*args, **kwargs):
+        raise MissingSecretError(keyring_account.alias)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(keyring_account.storage, "get_secret", fail)
+        with pytest.raises(MissingSecretError):
+            keyring_account.sign_transaction(transactions[0])
+
+    # The failed signature did not use up the limit.
+    assert keyring_account.sign_transaction(transactions[0]).signature
+    with pytest.raises(SigningPolicyError, match="Rate limit"):
+        keyring_account.sign_transaction(transactions[1])
@@ -0,0 +1,135 @@
+import socket
+import threading
+import time
+
+import pytest
+from eth_account import Account
+from eth_account.messages import encode_defunct
+
+from ape_keyring._agent import AGENT_SOCKET_ENV_VAR, SigningAgent, get_agent
+from ape_keyring._policy import SigningPolicy
+from ape_keyring.config import SigningPolicyConfig
+from ape_keyring.exceptions import AgentError, SigningPolicyError
+from ape_keyring.utils import get_transaction_fields
+
+
+@pytest.fixture
+def socket_path(tmp_path, monkeypatch):
+    socket_path = tmp_path / "agent.sock"
+    monkeypatch.setenv(AGENT_SOCKET_ENV_VAR, str(socket_path))
+    return socket_path
+
+
+@pytest.fixture
+def agent(storage, socket_path):
+    signing_agent = SigningAgent(storage, socket_path)
+    thread = threading.Thread(target=signing_agent.serve_forever, daemon=True)
+    thread.start()
+    while not socket_path.is_socket():
+        time.sleep(0.01)
+
+    yield signing_agent
+    signing_agent.shutdown()
+    thread.join()
+
+
+def test_proxy(container, keyring_account, agent, transactions, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("Private key accessed.")
+
+    assert get_agent(container.storage).addresses()[keyring_account.alias] == (
+        keyring_account.address
+    )
+    # Only the agent reads the key.
+    agent.unlock()
+    monkeypatch.setattr(container.storage, "get_secret", fail)
+
+    account = container[keyring_account.address]
+    assert account.alias == keyring_account.alias
+    assert keyring_account.alias in container.aliases
+
+    keyring_account.set_autosign(True)
+    try:
+        signature = keyring_account.sign_message("Hello Test")
+        signed = list(keyring_account.sign_transactions(transactions))
+    finally:
+        keyring_account.set_autosign(False)
+
+    message = encode_defunct(text="Hello Test")
+    signer = Account.recover_message(message, signature=signature.encode_rsv())
+    assert signer == keyring_account.address
+    for txn in signed:
+        signer = Account.recover_transaction(txn.serialize_transaction())
+        assert signer == keyring_account.address
+
+
+def test_deleted_account(container, keyring_account, agent):
+    alias = keyring_account.alias
+    agent.unlock()
+    container.delete_account(alias)
+    with pytest.raises(AgentError, match=f"Unknown account '{alias}'"):
+        keyring_account.sign_message("Hello Test")
+
+
+def test_missing_key(container, keyring_account, agent):
+    # Tracked without an address, but the key was deleted outside of the plugin.
+    alias = f"{keyring_account.alias}-missing"
+    container.storage._track(add=[alias])
+    try:
+        assert alias in list(container.aliases)
+        addresses = dict(container.iter_addresses())
+        assert container[keyring_account.address].alias == keyring_account.alias
+    finally:
+        container.storage._track(remove=[alias])
+
+    assert addresses[alias] is None
+    assert addresses[keyring_account.alias] == keyring_account.address
+
+
+def test_already_running(storage, agent):
+    with pytest.raises(AgentError, match="already listening"):
+        SigningAgent(storage, agent.socket_path).serve_forever()
+
+
+def test_policy_enforced_by_agent(container, keyring_account, agent, transactions):
+    agent.policy = SigningPolicy(max_value=0, rate_limits=[(1, 60)])
+    client = get_agent(container.storage)
+    fields = get_transaction_fields(transactions[0])
+    with pytest.raises(AgentError, match="exceeds the maximum"):
+        client.sign_transaction(keyring_account.alias, fields)
+
+    # Rate limits span every client.
+    client.sign_message(keyring_account.alias, encode_defunct(text="Hello Test"))
+    with pytest.raises(AgentError, match="Rate limit"):
+        get_agent(container.storage).sign_message(
+            keyring_account.alias, encode_defunct(text="Hello Test")
+        )
+
+
+def test_stale_socket(container, keyring_account, socket_path):
+    # Left behind by an agent that was killed.
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(str(socket_path))
+
+    assert keyring_account.alias in container.aliases
+    keyring_account.set_autosign(True)
+    try:
+        signature = keyring_account.sign_message("Hello Test")
+    finally:
+        keyring_account.set_autosign(False)
+
+    message = encode_defunct(text="Hello Test")
+    signer = Account.recover_message(message, signature=signature.encode_rsv())
+    assert signer == keyring_account.address
+    assert not socket_path.exists()
+
+
+def test_client_policy_with_agent(config, keyring_account, agent, transactions, monkeypatch):
+    # The agent has no policy, but the client's rules still apply.
+    policy_config = SigningPolicyConfig(enabled=True, max_value=0)
+    monkeypatch.setattr(config.get_config("keyring"), "signing_policy", policy_config)
+    with pytest.raises(SigningPolicyError, match="exceeds the maximum"):
+        keyring_account.sign_transaction(transactions[0])
+
+    with pytest.raises(SigningPolicyError, match="exceeds the maximum"):
+        list(keyring_account.sign_transactions(transactions))
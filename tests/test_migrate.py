@@ -0,0 +1,152 @@
+import keyring
+import pytest
+
+from ape_keyring._journal import TRACKER_GENERATION_KEY
+from ape_keyring.storage import SERVICE_NAME, SecretStorage, StorageLayout, TrackerFormat
+
+SECRETS = {"__MIGRATE_TEST_KEY_0__": "value-0", "__MIGRATE_TEST_KEY_1__": "value-1"}
+
+
+@pytest.fixture
+def layout_storage():
+    storage = SecretStorage("layout-test")
+    for key, secret in SECRETS.items():
+        storage.store_secret(key, secret)
+
+    yield storage
+
+    for key in SECRETS:
+        storage.delete_secret(key)
+
+    storage.migrate(StorageLayout.PER_KEY)
+
+
+def test_migrate(layout_storage):
+    layout_storage.migrate(StorageLayout.BUNDLED)
+    assert layout_storage.layout == StorageLayout.BUNDLED
+    assert keyring.get_password(SERVICE_NAME, layout_storage.vault_key)
+    for key, secret in SECRETS.items():
+        assert keyring.get_password(SERVICE_NAME, key) is None
+        assert layout_storage.get_secret(key) == secret
+
+    layout_storage.migrate(StorageLayout.PER_KEY)
+    assert layout_storage.layout == StorageLayout.PER_KEY
+    assert keyring.get_password(SERVICE_NAME, layout_storage.vault_key) is None
+    for key, secret in SECRETS.items():
+        assert keyring.get_password(SERVICE_NAME, key) == secret
+        assert layout_storage.get_secret(key) == secret
+
+
+def test_bundled_store_and_delete(layout_storage):
+    layout_storage.migrate(StorageLayout.BUNDLED)
+    layout_storage.store_secret("__MIGRATE_TEST_NEW__", "new-value")
+    assert layout_storage.get_secret("__MIGRATE_TEST_NEW__") == "new-value"
+
+    # Another process sees the change.
+    other = SecretStorage("layout-test")
+    assert other.get_many(layout_storage.keys) == {**SECRETS, "__MIGRATE_TEST_NEW__": "new-value"}
+
+    assert layout_storage.delete_secret("__MIGRATE_TEST_NEW__")
+    assert other.get_secret("__MIGRATE_TEST_NEW__") is None
+
+
+def test_migrate_cli(cli, runner, container):
+    result = runner.invoke(cli, ("keyring", "migrate", "layout", "bundled", "--only", "accounts"))
+    try:
+        assert result.exit_code == 0, result.output
+        assert container.storage.layout == StorageLayout.BUNDLED
+    finally:
+        container.storage.migrate(StorageLayout.PER_KEY)
+
+
+@pytest.fixture
+def journal_storage(storage):
+    storage.set_tracker_format(TrackerFormat.JOURNAL)
+    yield storage
+    storage.set_tracker_format(TrackerFormat.JSON)
+
+
+def test_journal(journal_storage):
+    snapshot = journal_storage.data_file_path.read_text()
+    other = SecretStorage(journal_storage._tracker_key)
+    try:
+        for key, secret in SECRETS.items():
+            journal_storage.store_secret(key, secret, metadata={"index": key[-3]})
+
+        journal_storage.delete_secret("__MIGRATE_TEST_KEY_0__")
+
+        # Only the journal was written to.
+        assert journal_storage.data_file_path.read_text() == snapshot
+        assert len(journal_storage.journal_file_path.read_text().splitlines()) == 4
+        for storage in (journal_storage, other, SecretStorage(journal_storage._tracker_key)):
+            assert "__MIGRATE_TEST_KEY_0__" not in storage
+            assert storage.get_secret("__MIGRATE_TEST_KEY_1__") == "value-1"
+            assert storage.get_metadata("__MIGRATE_TEST_KEY_1__") == {"index": "1"}
+
+    finally:
+        for key in SECRETS:
+            journal_storage.delete_secret(key)
+
+
+def test_journal_compact(journal_storage):
+    data = journal_storage.plugin_data
+    journal_storage.store_secret("__MIGRATE_TEST_KEY_0__", "value-0")
+    journal_storage.compact()
+    try:
+        assert journal_storage.journal_file_path.read_text().count("\n") == 1
+        other = SecretStorage(journal_storage._tracker_key)
+        assert "__MIGRATE_TEST_KEY_0__" in other
+        assert other.plugin_data[TRACKER_GENERATION_KEY] == data[TRACKER_GENERATION_KEY] + 1
+    finally:
+        journal_storage.delete_secret("__MIGRATE_TEST_KEY_0__")
+
+
+def test_journal_compact_in_background(storage):
+    compacting = SecretStorage(storage._tracker_key, journal_compact_size=1)
+    compacting.set_tracker_format(TrackerFormat.JOURNAL)
+    try:
+        compacting.store_secret("__MIGRATE_TEST_KEY_0__", "value-0")
+        compacting._compaction.join()
+        assert compacting.journal_file_path.read_text().count("\n") == 1
+        assert "__MIGRATE_TEST_KEY_0__" in SecretStorage(storage._tracker_key)
+    finally:
+        compacting.delete_secret("__MIGRATE_TEST_KEY_0__")
+        compacting.set_tracker_format(TrackerFormat.JSON)
+
+
+def test_journal_stale(journal_storage):
+    # A journal left behind by an interrupted compaction is not replayed.
+    journal = journal_storage.journal_file_path.read_text()
+    journal_storage.store_secret("__MIGRATE_TEST_KEY_0__", "value-0")
+    journal_storage.delete_secret("__MIGRATE_TEST_KEY_0__")
+    stale_journal = journal_storage.journal_file_path.read_text()
+    journal_storage.compact()
+    journal_storage.journal_file_path.write_text(stale_journal)
+    assert journal != stale_journal
+    assert "__MIGRATE_TEST_KEY_0__" not in SecretStorage(journal_storage._tracker_key)
+
+
+def test_journal_unfinished_line(journal_storage):
+    with open(journal_storage.journal_file_path, "a") as file:
+        file.write('[["add", "secrets", ["__MIGRATE_TEST_KEY_0__"')
+
+    assert "__MIGRATE_TEST_KEY_0__" not in SecretStorage(journal_storage._tracker_key)
+    journal_storage.store_secret("__MIGRATE_TEST_KEY_1__", "value-1")
+    try:
+        other = SecretStorage(journal_storage._tracker_key)
+        assert "__MIGRATE_TEST_KEY_1__" in other
+        assert "__MIGRATE_TEST_KEY_0__" not in other
+    finally:
+        journal_storage.delete_secret("__MIGRATE_TEST_KEY_1__")
+
+
+def test_migrate_tracker_cli(cli, runner, container):
+    result = runner.invoke(cli, ("keyring", "migrate", "tracker", "journal"))
+    try:
+        assert result.exit_code == 0, result.output
+        assert container.storage.tracker_format == TrackerFormat.JOURNAL
+        assert container.storage.journal_file_path.is_file()
+    finally:
+        container.storage.set_tracker_format(TrackerFormat.JSON)
+
+    assert not container.storage.journal_file_path.exists()
@@ -1,9 +1,16 @@
 import os
 
 import pytest
+from ape.utils import load_config
 
+import ape_keyring._secrets
 from ape_keyring import Scope
-from ape_keyring.config import KeyringConfig
+from ape_keyring._dotenv import format_dotenv, parse_dotenv
+from ape_keyring._environ import DeferredEnviron
+from ape_keyring._secrets import SecretKeys, get_secret_manager
+from ape_keyring.config import EnvVarSync, KeyringConfig
+from ape_keyring.exceptions import DotenvParseError
+from ape_keyring.storage import SecretStorage
 
 GLOBAL_SECRET_KEY = "__GLOBAL_TEST_SECRET__"
 PROJECT_SECRET_KEY = "__PROJECT_TEST_SECRET__"
@@ -23,7 +30,7 @@ def clean(secret_manager):
     if GLOBAL_SECRET_KEY in secret_manager.global_keys:
         secret_manager.delete_secret(GLOBAL_SECRET_KEY)
     if PROJECT_SECRET_KEY in secret_manager.project_keys:
-        secret_manager.delete_secret(PROJECT_SECRET_KEY)
+        secret_manager.delete_secret(PROJECT_SECRET_KEY, scope=Scope.PROJECT)
 
 
 @pytest.fixture(autouse=True)
@@ -83,3 +90,240 @@ def test_secrets_in_env(temp_secrets, secret_manager, key, value, scope):
     assert os.environ.get(key) == value
     secret_manager.delete_secret(key, scope=scope)
     assert not os.environ.get(key)
+
+
+def test_partition(temp_secrets, secret_manager):
+    secret_keys = secret_manager.partition()
+    assert secret_keys.exist
+    assert GLOBAL_SECRET_KEY in secret_keys.global_keys
+    assert GLOBAL_SECRET_KEY not in secret_keys.project_keys
+    assert PROJECT_SECRET_KEY in secret_keys.project_keys
+    assert PROJECT_SECRET_KEY not in secret_keys.global_keys
+
+
+def test_partition_unindexed_project_key(storage, secret_manager):
+    secret_manager.partition()  # Build the index first.
+    # Written without updating the index, such as by an older plugin version.
+    key = f"{PROJECT_SECRET_KEY}{secret_manager._project_key}"
+    other_key = f"{PROJECT_SECRET_KEY}<<project=other-project>>"
+    storage.store_secrets({key: PROJECT_SECRET_VALUE, other_key: "other-value"})
+    try:
+        secret_keys = secret_manager.partition()
+    finally:
+        storage.delete_secret(key)
+        storage.delete_secret(other_key)
+
+    assert PROJECT_SECRET_KEY in secret_keys.project_keys
+    assert key not in secret_keys.global_keys
+    assert other_key not in secret_keys.global_keys
+
+
+@pytest.mark.parametrize("sync", (EnvVarSync.LAZY, EnvVarSync.BACKGROUND))
+def test_set_environment_variables_deferred(temp_global_secret, secret_manager, monkeypatch, sync):
+    config = KeyringConfig(set_env_vars=True, env_var_sync=sync, env_var_keys=[GLOBAL_SECRET_KEY])
+    monkeypatch.setattr(type(secret_manager), "config", property(lambda _: config))
+    del os.environ[GLOBAL_SECRET_KEY]
+
+    secret_manager.set_environment_variables()
+    try:
+        assert isinstance(os.environ, DeferredEnviron)
+        assert os.environ.get(GLOBAL_SECRET_KEY) == GLOBAL_SECRET_VALUE
+        assert not isinstance(os.environ, DeferredEnviron)
+    finally:
+        secret_manager.ensure_environment_variables()
+
+
+def test_ensure_environment_variables_background(temp_global_secret, secret_manager, monkeypatch):
+    config = KeyringConfig(
+        set_env_vars=True, env_var_sync=EnvVarSync.BACKGROUND, env_var_keys=[GLOBAL_SECRET_KEY]
+    )
+    monkeypatch.setattr(type(secret_manager), "config", property(lambda _: config))
+    del os.environ[GLOBAL_SECRET_KEY]
+
+    secret_manager.set_environment_variables()
+    secret_manager.ensure_environment_variables()
+    assert not isinstance(os.environ, DeferredEnviron)
+    assert os.environ[GLOBAL_SECRET_KEY] == GLOBAL_SECRET_VALUE
+
+
+def test_deferred_environ_uninstalled_when_set():
+    environ = DeferredEnviron(os.environ, ["DEFERRED_TEST_VAR"], lambda names: None)
+    environ.install()
+    try:
+        # Loaded by something other than a read, such as a background thread.
+        environ["DEFERRED_TEST_VAR"] = "value"
+        assert not isinstance(os.environ, DeferredEnviron)
+    finally:
+        environ.uninstall()
+        os.environ.pop("DEFERRED_TEST_VAR", None)
+
+
+def test_config_cached(tmp_path, storage, monkeypatch):
+    config_file = tmp_path / "ape-config.yaml"
+    config_file.write_text("keyring:\n  set_env_vars: true\n")
+    manager = get_secret_manager(tmp_path, storage=storage)
+    loads = []
+
+    def count_loads(path):
+        loads.append(path)
+        return load_config(path)
+
+    monkeypatch.setattr(ape_keyring._secrets, "load_config", count_loads)
+    assert manager.config.set_env_vars is True
+    assert manager.do_set_env_vars
+    assert get_secret_manager(tmp_path, storage=storage).config.set_env_vars is True
+    assert len(loads) == 1
+
+    config_file.write_text("keyring:\n  set_env_vars: false\n")
+    assert manager.config.set_env_vars is False
+    assert len(loads) == 2
+
+
+def test_parse_dotenv():
+    lines = [
+        "# comment",
+        "",
+        "A=1",
+        "export B = two words # comment",
+        "C='literal \\n $x'",
+        'D="line\\nbreak \\"quoted\\""',
+        "E=",
+    ]
+    assert list(parse_dotenv(lines)) == [
+        ("A", "1"),
+        ("B", "two words"),
+        ("C", "literal \\n $x"),
+        ("D", 'line\nbreak "quoted"'),
+        ("E", ""),
+    ]
+
+
+@pytest.mark.parametrize("line", ("NO_SEPARATOR", "1BAD=value", 'OPEN="value'))
+def test_parse_dotenv_invalid(line):
+    with pytest.raises(DotenvParseError, match="line 1"):
+        list(parse_dotenv([line]))
+
+
+@pytest.mark.parametrize("value", ("simple", "with space", 'a "quote"\nand $dollar\\'))
+def test_format_dotenv_round_trip(value):
+    assert list(parse_dotenv([format_dotenv("KEY", value)])) == [("KEY", value)]
+
+
+@pytest.mark.parametrize("scope", (Scope.GLOBAL.value, Scope.PROJECT.value))
+def test_load_and_export(cli, runner, project, tmp_path, scope):
+    # The CLI uses the default storage.
+    cli_secret_manager = get_secret_manager(project.path)
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        f"{GLOBAL_SECRET_KEY}={GLOBAL_SECRET_VALUE}\n{PROJECT_SECRET_KEY}='with space'\n"
+    )
+    try:
+        result = runner.invoke(cli, ["keyring", "secrets", "load", str(env_file), "--scope", scope])
+        assert result.exit_code == 0, result.output
+        assert "Loaded 2 secrets" in result.output
+        assert cli_secret_manager.get_secrets(scope=scope) == {
+            GLOBAL_SECRET_KEY: GLOBAL_SECRET_VALUE,
+            PROJECT_SECRET_KEY: "with space",
+        }
+        assert os.environ[PROJECT_SECRET_KEY] == "with space"
+
+        result = runner.invoke(cli, ["keyring", "secrets", "export", "--scope", scope])
+        assert result.exit_code == 0, result.output
+        assert result.output == (
+            f'{GLOBAL_SECRET_KEY}={GLOBAL_SECRET_VALUE}\n{PROJECT_SECRET_KEY}="with space"\n'
+        )
+
+    finally:
+        for key in (GLOBAL_SECRET_KEY, PROJECT_SECRET_KEY):
+            cli_secret_manager.delete_secret(key, scope=scope)
+
+
+def test_export_file_private(cli, runner, project, tmp_path):
+    cli_secret_manager = get_secret_manager(project.path)
+    cli_secret_manager.store_secret(GLOBAL_SECRET_KEY, GLOBAL_SECRET_VALUE)
+    output = tmp_path / ".env"
+    output.write_text("")
+    output.chmod(0o644)
+    try:
+        result = runner.invoke(cli, ["keyring", "secrets", "export", "--output", str(output)])
+        assert result.exit_code == 0, result.output
+        assert f"{GLOBAL_SECRET_KEY}={GLOBAL_SECRET_VALUE}\n" in output.read_text()
+        assert output.stat().st_mode & 0o777 == 0o600
+
+    finally:
+        cli_secret_manager.delete_secret(GLOBAL_SECRET_KEY)
+
+
+def test_export_skips_invalid_names(cli, runner, project, tmp_path):
+    cli_secret_manager = get_secret_manager(project.path)
+    cli_secret_manager.store_secrets({GLOBAL_SECRET_KEY: GLOBAL_SECRET_VALUE, "MY-KEY": "value"})
+    output = tmp_path / ".env"
+    try:
+        result = runner.invoke(cli, ["keyring", "secrets", "export", "--output", str(output)])
+        assert result.exit_code == 0, result.output
+        assert "Skipping secrets with invalid .env names: MY-KEY." in result.output
+        assert dict(parse_dotenv(output.read_text().splitlines())) == {
+            GLOBAL_SECRET_KEY: GLOBAL_SECRET_VALUE
+        }
+
+    finally:
+        for key in (GLOBAL_SECRET_KEY, "MY-KEY"):
+            cli_secret_manager.delete_secret(key)
+
+
+def test_load_skips_empty_values(cli, runner, project, tmp_path):
+    cli_secret_manager = get_secret_manager(project.path)
+    env_file = tmp_path / ".env"
+    env_file.write_text(f"{GLOBAL_SECRET_KEY}={GLOBAL_SECRET_VALUE}\n{PROJECT_SECRET_KEY}=\n")
+    try:
+        result = runner.invoke(cli, ["keyring", "secrets", "load", str(env_file)])
+        assert result.exit_code == 0, result.output
+        assert f"Skipping secrets with empty values: {PROJECT_SECRET_KEY}" in result.output
+        assert "Loaded 1 secret." in result.output
+        assert PROJECT_SECRET_KEY not in cli_secret_manager.global_keys
+
+    finally:
+        cli_secret_manager.delete_secret(GLOBAL_SECRET_KEY)
+
+
+def test_project_index(temp_secrets, secret_manager, storage):
+    key = f"{PROJECT_SECRET_KEY}<<project={secret_manager.project_name}>>"
+    assert storage.get_namespace(secret_manager.project_name) == {PROJECT_SECRET_KEY: key}
+    assert storage.get_key_namespace(key) == secret_manager.project_name
+    assert storage.get_key_namespace(GLOBAL_SECRET_KEY) is None
+
+    secret_manager.delete_secret(PROJECT_SECRET_KEY, scope=Scope.PROJECT)
+    assert PROJECT_SECRET_KEY not in storage.get_namespace(secret_manager.project_name)
+
+
+def test_project_index_migrated(tmp_path):
+    # Keys scoped by suffix before the index existed.
+    storage = SecretStorage("project-index-test")
+    storage.store_secrets(
+        {"A<<project=other>>": "other-a", "A": "global-a", "B<<project=mine>>": "b"}
+    )
+    storage._update_public_data(lambda d: d.pop(storage.namespaces_key, None))
+    assert not storage.namespaces_indexed
+
+    manager = get_secret_manager(tmp_path / "mine", storage=storage)
+    try:
+        assert manager.partition() == SecretKeys(global_keys=["A"], project_keys=["B"])
+        assert storage.namespaces_indexed
+        assert storage.get_namespace("other") == {"A": "A<<project=other>>"}
+    finally:
+        storage.delete_all()
+
+
+def test_resolve(temp_global_secret, secret_manager):
+    assert secret_manager.resolve(GLOBAL_SECRET_KEY) == Scope.GLOBAL
+    assert secret_manager.get_secret(GLOBAL_SECRET_KEY, resolve=True) == GLOBAL_SECRET_VALUE
+
+    secret_manager.store_secret(GLOBAL_SECRET_KEY, PROJECT_SECRET_VALUE, scope=Scope.PROJECT)
+    try:
+        assert secret_manager.resolve(GLOBAL_SECRET_KEY) == Scope.PROJECT
+        assert secret_manager.get_secret(GLOBAL_SECRET_KEY, resolve=True) == PROJECT_SECRET_VALUE
+    finally:
+        secret_manager.delete_secret(GLOBAL_SECRET_KEY, scope=Scope.PROJECT)
+
+    assert secret_manager.resolve("__NOT_A_SECRET__") is None
+    assert secret_manager.get_secret("__NOT_A_SECRET__", resolve=True) == ""
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from ape_keyring._stats import STATS_FILE_NAME, load_stats, stats
+
+TEST_KEY = "__STATS_TEST_KEY__"
+
+
+@pytest.fixture
+def stats_path(storage):
+    path = storage.data_folder / STATS_FILE_NAME
+    path.unlink(missing_ok=True)
+    was_enabled = stats.enabled
+    stats.reset()
+    stats.enable(lambda: path)
+    yield path
+    stats.enabled = was_enabled
+    stats.reset()
+    path.unlink(missing_ok=True)
+
+
+def test_stats(storage, stats_path):
+    storage.store_secret(TEST_KEY, "value")
+    storage.get_secret(TEST_KEY)
+    storage.delete_secret(TEST_KEY)
+
+    operations = stats.operations
+    assert operations["backend.get"].count == 1
+    assert operations["backend.set"].count == 1
+    assert operations["backend.delete"].count == 1
+    assert operations["tracker.write"].count == 2
+
+    stats.dump()
+    stats.dump()  # Nothing new to merge.
+    assert not stats.operations
+    assert load_stats(stats_path)["backend.get"].count == 1
+
+
+def test_stats_disabled(storage, stats_path):
+    stats.enabled = False
+    storage.get_secret(TEST_KEY)
+    assert not stats.operations
+
+
+def test_stats_cli(cli, runner, storage, stats_path):
+    storage.store_secret(TEST_KEY, "value")
+    storage.delete_secret(TEST_KEY)
+    stats.dump()
+
+    result = runner.invoke(cli, ("keyring", "stats"))
+    assert result.exit_code == 0, result.output
+    assert "backend.set" in result.output
+
+    result = runner.invoke(cli, ("keyring", "stats", "--json"))
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output) == {
+        k: v.model_dump() for k, v in load_stats(stats_path).items()
+    }
+
+    result = runner.invoke(cli, ("keyring", "stats", "--reset"))
+    assert result.exit_code == 0, result.output
+    assert not stats_path.is_file()
@@ -0,0 +1,262 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import keyring
+import pytest
+from keyring.errors import KeyringError, PasswordDeleteError
+
+import ape_keyring.storage
+from ape_keyring.exceptions import TrackerLockError
+from ape_keyring.storage import SERVICE_NAME, DeleteSummary, SecretStorage, StorageLayout
+from ape_keyring.utils import file_lock
+
+TEST_KEY = "__STORAGE_TEST_KEY__"
+TEST_SECRET = "test-storage-secret-value"
+
+
+@pytest.fixture
+def temp_secret(storage):
+    storage.store_secret(TEST_KEY, TEST_SECRET)
+    yield TEST_KEY
+    storage.delete_secret(TEST_KEY)
+
+
+def test_keys_cached(storage, temp_secret, monkeypatch):
+    _ = storage.keys  # Ensure loaded.
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Tracker re-parsed.")
+
+    monkeypatch.setattr(json, "loads", fail)
+    assert temp_secret in storage.keys
+    assert temp_secret in storage
+    assert storage.get_secret(temp_secret) == TEST_SECRET
+
+
+def test_keys_reloaded_when_file_changes(storage, temp_secret):
+    other = SecretStorage(storage._tracker_key)
+    assert temp_secret in other
+
+    storage.delete_secret(temp_secret)
+    assert temp_secret not in other
+
+    storage.store_secret(temp_secret, TEST_SECRET)
+    assert temp_secret in other
+
+
+def test_store_secret_concurrently(storage):
+    keys = [f"{TEST_KEY}_{idx}" for idx in range(8)]
+
+    def store(key):
+        # Separate instances act like separate processes sharing the tracker file.
+        SecretStorage(storage._tracker_key).store_secret(key, TEST_SECRET)
+
+    with ThreadPoolExecutor(max_workers=len(keys)) as pool:
+        list(pool.map(store, keys))
+
+    try:
+        assert all(k in storage for k in keys)
+    finally:
+        for key in keys:
+            storage.delete_secret(key)
+
+
+def test_store_secret_lock_timeout(storage):
+    other = SecretStorage(storage._tracker_key, lock_timeout=0.05)
+    with file_lock(storage.lock_file_path, storage.lock_timeout):
+        with pytest.raises(TrackerLockError):
+            other.store_secret(TEST_KEY, TEST_SECRET)
+
+    assert TEST_KEY not in storage
+
+
+def test_get_many(storage, temp_secret):
+    other_key = f"{TEST_KEY}_OTHER"
+    storage.store_secret(other_key, "other-value")
+    try:
+        actual = storage.get_many([other_key, "__NOT_TRACKED__", temp_secret])
+    finally:
+        storage.delete_secret(other_key)
+
+    assert list(actual.items()) == [
+        (other_key, "other-value"),
+        ("__NOT_TRACKED__", None),
+        (temp_secret, TEST_SECRET),
+    ]
+
+
+def test_items(storage, temp_secret):
+    assert (temp_secret, TEST_SECRET) in storage.items()
+    assert list(storage) == storage.items()
+
+
+def test_async_get_secret(storage, temp_secret):
+    assert asyncio.run(storage.async_get_secret(temp_secret)) == TEST_SECRET
+
+
+def test_delete_all(monkeypatch):
+    storage = SecretStorage("delete-all-test")
+    storage.store_secrets({"deleted": "1", "missing": "2", "failed": "3"})
+    keyring.delete_password(SERVICE_NAME, "missing")
+    delete_password = keyring.delete_password
+
+    def fail_some(service, key):
+        if key == "failed":
+            raise KeyringError("locked")
+
+        delete_password(service, key)
+
+    monkeypatch.setattr(keyring, "delete_password", fail_some)
+    summary = storage.delete_all()
+    assert summary == DeleteSummary(
+        deleted=["deleted"], missing=["missing"], failed={"failed": "locked"}
+    )
+    assert storage.keys == ["failed"]
+    assert SecretStorage(storage._tracker_key).keys == ["failed"]
+
+    monkeypatch.undo()
+    assert storage.delete_all().deleted == ["failed"]
+    assert storage.keys == []
+
+
+def test_delete_all_not_deleted(monkeypatch):
+    storage = SecretStorage("delete-all-not-deleted-test")
+    storage.store_secrets({"kept": "1"})
+
+    def refuse(service, key):
+        raise PasswordDeleteError("denied")
+
+    monkeypatch.setattr(keyring, "delete_password", refuse)
+    summary = storage.delete_all()
+    assert summary.missing == []
+    assert list(summary.failed) == ["kept"]
+    assert storage.keys == ["kept"]
+
+    monkeypatch.undo()
+    assert storage.delete_all().deleted == ["kept"]
+
+
+def test_delete_all_bundled():
+    storage = SecretStorage("delete-all-bundled-test")
+    storage.migrate(StorageLayout.BUNDLED)
+    storage.store_secrets({"a": "1", "b": "2"})
+    summary = storage.delete_all()
+    assert summary == DeleteSummary(deleted=["a", "b"], missing=[], failed={})
+    assert storage.keys == []
+    assert storage.get_secret("a") is None
+
+
+@pytest.mark.parametrize("window", (0, 1, 3))
+def test_iter_items(storage, window):
+    secrets = {f"{TEST_KEY}_{idx}": f"value-{idx}" for idx in range(5)}
+    storage.store_secrets(secrets)
+    try:
+        keys = [*secrets, "__NOT_TRACKED__"]
+        assert list(storage.iter_items(keys, window=window)) == list(secrets.items())
+    finally:
+        for key in secrets:
+            storage.delete_secret(key)
+
+
+def test_iter_items_cancelled(storage, monkeypatch):
+    secrets = {f"{TEST_KEY}_{idx}": f"value-{idx}" for idx in range(20)}
+    storage.store_secrets(secrets)
+    lookups = []
+    get_secret = ape_keyring.storage._get_secret
+
+    def slow_get_secret(key):
+        lookups.append(key)
+        time.sleep(0.01)
+        return get_secret(key)
+
+    monkeypatch.setattr(ape_keyring.storage, "_get_secret", slow_get_secret)
+    try:
+        items = storage.iter_items(secrets, window=2)
+        assert next(items) == (f"{TEST_KEY}_0", "value-0")
+        items.close()
+        time.sleep(0.05)
+        assert len(lookups) <= 3
+    finally:
+        monkeypatch.undo()
+        for key in secrets:
+            storage.delete_secret(key)
+
+
+def test_misses_cached(storage, monkeypatch):
+    lookups = []
+    get_secret = ape_keyring.storage._get_secret
+
+    def count_lookups(key):
+        lookups.append(key)
+        return get_secret(key)
+
+    monkeypatch.setattr(ape_keyring.storage, "_get_secret", count_lookups)
+    # Tracked but deleted from the backend outside of the plugin.
+    storage.store_secret(TEST_KEY, TEST_SECRET)
+    keyring.delete_password(SERVICE_NAME, TEST_KEY)
+    miss_count = storage.miss_count
+    cached_miss_count = storage.cached_miss_count
+    try:
+        assert storage.get_secret(TEST_KEY) is None
+        assert storage.get_secret(TEST_KEY) is None
+        assert storage.get_many([TEST_KEY]) == {TEST_KEY: None}
+        assert lookups == [TEST_KEY]
+        assert storage.miss_count == miss_count + 3
+        assert storage.cached_miss_count == cached_miss_count + 2
+
+        # Storing the secret forgets the miss.
+        storage.store_secret(TEST_KEY, TEST_SECRET)
+        assert storage.get_secret(TEST_KEY) == TEST_SECRET
+    finally:
+        storage.delete_secret(TEST_KEY)
+
+
+def test_misses_expire(storage):
+    other = SecretStorage(storage._tracker_key, miss_ttl=1.0)
+    storage.store_secret(TEST_KEY, TEST_SECRET)
+    keyring.delete_password(SERVICE_NAME, TEST_KEY)
+    try:
+        assert other.get_secret(TEST_KEY) is None
+
+        # Restored in the backend without changing the tracker.
+        keyring.set_password(SERVICE_NAME, TEST_KEY, TEST_SECRET)
+        assert other.get_secret(TEST_KEY) is None
+        time.sleep(1.0)
+        assert other.get_secret(TEST_KEY) == TEST_SECRET
+    finally:
+        storage.delete_secret(TEST_KEY)
+
+
+def test_miss_ttl_config(config):
+    miss_ttl = config.get_config("keyring").miss_ttl
+    assert ape_keyring.storage.account_storage.miss_ttl == miss_ttl
+    assert ape_keyring.storage.secret_storage.miss_ttl == miss_ttl
+
+
+def test_misses_forgotten_when_tracker_changes(storage):
+    other = SecretStorage(storage._tracker_key)
+    assert other.get_secret(TEST_KEY) is None
+
+    # Another process stores the secret.
+    storage.store_secret(TEST_KEY, TEST_SECRET)
+    try:
+        assert other.get_secret(TEST_KEY) == TEST_SECRET
+    finally:
+        storage.delete_secret(TEST_KEY)
+
+
+def test_migrate_ignores_misses(storage):
+    storage.store_secret(TEST_KEY, TEST_SECRET)
+    keyring.delete_password(SERVICE_NAME, TEST_KEY)
+    try:
+        assert storage.get_secret(TEST_KEY) is None
+
+        # Restored in the backend without changing the tracker.
+        keyring.set_password(SERVICE_NAME, TEST_KEY, TEST_SECRET)
+        storage.migrate(StorageLayout.BUNDLED)
+        assert storage.get_secret(TEST_KEY) == TEST_SECRET
+    finally:
+        storage.migrate(StorageLayout.PER_KEY)
+        storage.delete_secret(TEST_KEY)
@@ -0,0 +1,54 @@
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ape_keyring.storage import SERVICE_NAME
+from ape_keyring.testing import EphemeralBackend
+
+
+def _set_password(path, username):
+    EphemeralBackend(path=path).set_password(SERVICE_NAME, username, f"{username}-value")
+
+
+def test_storage_per_instance():
+    backend = EphemeralBackend()
+    backend.set_password(SERVICE_NAME, "__TESTING_KEY__", "value")
+    assert backend.get_password(SERVICE_NAME, "__TESTING_KEY__") == "value"
+    assert EphemeralBackend().get_password(SERVICE_NAME, "__TESTING_KEY__") is None
+
+
+def test_shared_file(tmp_path):
+    path = tmp_path / "keyring.json"
+    backend = EphemeralBackend(path=path)
+    other = EphemeralBackend(path=path)
+    other.set_password(SERVICE_NAME, "__TESTING_KEY__", "value")
+    assert backend.get_password(SERVICE_NAME, "__TESTING_KEY__") == "value"
+
+    backend.delete_password(SERVICE_NAME, "__TESTING_KEY__")
+    assert other.get_password(SERVICE_NAME, "__TESTING_KEY__") is None
+    with pytest.raises(AssertionError):
+        other.delete_password(SERVICE_NAME, "__TESTING_KEY__")
+
+
+def test_shared_file_concurrent(tmp_path):
+    path = tmp_path / "keyring.json"
+    backend = EphemeralBackend(path=path)
+    usernames = [f"__TESTING_KEY_{idx}__" for idx in range(8)]
+
+    # Half from other processes, half from threads.
+    processes = [
+        multiprocessing.get_context("fork").Process(target=_set_password, args=(path, u))
+        for u in usernames[:4]
+    ]
+    for process in processes:
+        process.start()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda u: _set_password(path, u), usernames[4:]))
+
+    for process in processes:
+        process.join()
+
+    for username in usernames:
+        assert backend.get_password(SERVICE_NAME, username) == f"{username}-value"